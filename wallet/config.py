@@ -1,75 +1,94 @@
 import os
-from pathlib import Path
 from urllib.parse import unquote, urlparse
 
 from django.core.exceptions import ImproperlyConfigured
 from dotenv import load_dotenv
 
+_ENV_CACHE = {}
+_TRUTHY = frozenset(("1", "true", "yes", "on"))
+
 
 def load_environment(base_dir):
-    load_dotenv(base_dir / ".env")
+    load_dotenv(os.path.join(base_dir, ".env"))
+    _ENV_CACHE.clear()
+    _ENV_CACHE.update(os.environ)
+
+
+def get_env(name, default=None):
+    return _ENV_CACHE.get(name, default)
 
 
 def env_bool(name, default=False):
-    value = os.getenv(name)
+    value = _ENV_CACHE.get(name)
     if value is None:
         return default
-    return value.strip().lower() in {"1", "true", "yes", "on"}
+    # A set but blank variable is false, never the (possibly unsafe) default.
+    return value.strip().lower() in _TRUTHY
 
 
-def env_int(name, default):
-    value = os.getenv(name)
+def env_num(name, default, *, cast, min_=None, max_=None, exclusive_min=False):
+    value = _ENV_CACHE.get(name)
     if value is None or value == "":
-        return default
-    try:
-        return int(value)
-    except ValueError as exc:
-        raise ImproperlyConfigured(f"{name} must be an integer") from exc
+        result = default
+    else:
+        try:
+            result = cast(value)
+        except ValueError as exc:
+            kind = "an integer" if cast is int else "a number"
+            raise ImproperlyConfigured(f"{name} must be {kind}") from exc
+
+    if min_ is not None and (result < min_ or (exclusive_min and result == min_)):
+        comparator = ">" if exclusive_min else ">="
+        raise ImproperlyConfigured(f"{name} must be {comparator} {min_}")
+    if max_ is not None and result > max_:
+        raise ImproperlyConfigured(f"{name} must be <= {max_}")
+    return result
+
+
+def env_int(name, default):
+    return env_num(name, default, cast=int)
 
 
 def env_float(name, default):
-    value = os.getenv(name)
-    if value is None or value == "":
-        return default
-    try:
-        return float(value)
-    except ValueError as exc:
-        raise ImproperlyConfigured(f"{name} must be a number") from exc
+    return env_num(name, default, cast=float)
 
 
 def env_list(name, default=None):
-    value = os.getenv(name)
+    value = _ENV_CACHE.get(name)
     if value is None:
         return default or []
-    return [item.strip() for item in value.split(",") if item.strip()]
+    return [item for item in map(str.strip, value.split(",")) if item]
 
 
 def _sqlite_name(base_dir, raw_name):
     if raw_name == ":memory:":
         return raw_name
-    path = Path(raw_name)
-    if path.is_absolute():
-        return str(path)
-    return str(base_dir / path)
+    if os.path.isabs(raw_name):
+        return raw_name
+    return os.path.join(base_dir, raw_name)
 
 
 def _database_from_url(base_dir, database_url):
     parsed = urlparse(database_url)
-    scheme = parsed.scheme.split("+", 1)[0]
+    scheme = parsed.scheme.split("+", 1)[0].lower()
 
     if scheme in {"postgres", "postgresql"}:
+        try:
+            port = parsed.port
+        except ValueError as exc:
+            raise ImproperlyConfigured("DATABASE_URL has an invalid port") from exc
         return {
             "ENGINE": "django.db.backends.postgresql",
             "NAME": unquote(parsed.path.lstrip("/")),
             "USER": unquote(parsed.username or ""),
             "PASSWORD": unquote(parsed.password or ""),
             "HOST": parsed.hostname or "",
-            "PORT": str(parsed.port or ""),
+            "PORT": str(port or ""),
         }
 
     if scheme == "sqlite":
         if parsed.path in {"", "/"}:
-            name = str(base_dir / "db.sqlite3")
+            name = os.path.join(base_dir, "db.sqlite3")
         else:
             name = unquote(parsed.path)
             if parsed.netloc:
@@ -85,12 +104,12 @@ def _database_from_url(base_dir, database_url):
 
 
 def build_databases(base_dir):
-    database_url = os.getenv("DATABASE_URL")
+    database_url = get_env("DATABASE_URL")
     if database_url:
         return database_url, {"default": _database_from_url(base_dir, database_url)}
 
-    db_engine = os.getenv("DB_ENGINE", "django.db.backends.sqlite3")
-    raw_db_name = os.getenv("DB_NAME", "db.sqlite3")
+    db_engine = get_env("DB_ENGINE", "django.db.backends.sqlite3")
+    raw_db_name = get_env("DB_NAME", "db.sqlite3")
     db_name = (
         _sqlite_name(base_dir, raw_db_name)
         if db_engine == "django.db.backends.sqlite3"
@@ -101,9 +120,9 @@ def build_databases(base_dir):
         "default": {
             "ENGINE": db_engine,
             "NAME": db_name,
-            "USER": os.getenv("DB_USER", ""),
-            "PASSWORD": os.getenv("DB_PASSWORD", ""),
-            "HOST": os.getenv("DB_HOST", ""),
-            "PORT": os.getenv("DB_PORT", ""),
+            "USER": get_env("DB_USER", ""),
+            "PASSWORD": get_env("DB_PASSWORD", ""),
+            "HOST": get_env("DB_HOST", ""),
+            "PORT": get_env("DB_PORT", ""),
         }
     }
@@ -0,0 +1,19 @@
+import json
+import logging
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, default=str)
+
+
+class StructuredFormatter(logging.Formatter):
+    def format(self, record):
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        if record.stack_info:
+            payload["stack_info"] = self.formatStack(record.stack_info)
+        return _ENCODER.encode(payload)
@@ -1,4 +1,5 @@
 import os
+import sys
 from pathlib import Path
 
 from django.core.exceptions import ImproperlyConfigured
@@ -6,19 +7,20 @@ from django.core.exceptions import ImproperlyConfigured
 from wallet.config import (
     build_databases,
     env_bool,
-    env_float,
-    env_int,
     env_list,
+    env_num,
+    get_env,
     load_environment,
 )
 
-BASE_DIR = Path(__file__).resolve().parent.parent
-load_environment(BASE_DIR)
+_BASE_DIR = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+BASE_DIR = Path(_BASE_DIR)
+load_environment(_BASE_DIR)
 
 
 DEBUG = env_bool("DEBUG", default=True)
 
-SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "")
+SECRET_KEY = get_env("DJANGO_SECRET_KEY", "")
 if not SECRET_KEY:
     if DEBUG:
         SECRET_KEY = "dev-only-secret-key"
@@ -29,6 +31,8 @@ ALLOWED_HOSTS = env_list("ALLOWED_HOSTS", ["127.0.0.1", "localhost"])
 if not DEBUG and not ALLOWED_HOSTS:
     raise ImproperlyConfigured("ALLOWED_HOSTS must be set when DEBUG=False")
 
+ENABLE_ADMIN = env_bool("ENABLE_ADMIN", default=DEBUG)
+
 INSTALLED_APPS = [
     "django.contrib.admin",
     "django.contrib.auth",
@@ -50,6 +54,33 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+_CONTEXT_PROCESSORS = [
+    "django.template.context_processors.debug",
+    "django.template.context_processors.request",
+    "django.contrib.auth.context_processors.auth",
+    "django.contrib.messages.context_processors.messages",
+]
+
+if not ENABLE_ADMIN:
+    INSTALLED_APPS = [
+        app
+        for app in INSTALLED_APPS
+        if app not in {"django.contrib.admin", "django.contrib.messages"}
+    ]
+    MIDDLEWARE = [
+        middleware
+        for middleware in MIDDLEWARE
+        if middleware != "django.contrib.messages.middleware.MessageMiddleware"
+    ]
+    _CONTEXT_PROCESSORS = [
+        processor
+        for processor in _CONTEXT_PROCESSORS
+        if processor != "django.contrib.messages.context_processors.messages"
+    ]
+
+INSTALLED_APPS = tuple(map(sys.intern, INSTALLED_APPS))
+MIDDLEWARE = tuple(map(sys.intern, MIDDLEWARE))
+
 ROOT_URLCONF = "wallet.urls"
 
 TEMPLATES = [
@@ -58,21 +89,34 @@ TEMPLATES = [
         "DIRS": [],
         "APP_DIRS": True,
         "OPTIONS": {
-            "context_processors": [
-                "django.template.context_processors.debug",
-                "django.template.context_processors.request",
-                "django.contrib.auth.context_processors.auth",
-                "django.contrib.messages.context_processors.messages",
-            ],
+            "context_processors": _CONTEXT_PROCESSORS,
         },
     },
 ]
 
 WSGI_APPLICATION = "wallet.wsgi.application"
 
-DATABASE_URL, DATABASES = build_databases(BASE_DIR)
-
-if not DEBUG and not DATABASE_URL and not os.getenv("DB_NAME"):
+DATABASE_URL, DATABASES = build_databases(_BASE_DIR)
+# Long-running executor workers should keep their connections between cycles;
+# health checks then replace a connection the server has dropped.
+# "none" keeps connections open indefinitely (Django's CONN_MAX_AGE=None).
+DATABASES["default"]["CONN_MAX_AGE"] = (
+    None
+    if get_env("DB_CONN_MAX_AGE", "").strip().lower() == "none"
+    else env_num("DB_CONN_MAX_AGE", 0, cast=int, min_=0)
+)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env_bool("DB_CONN_HEALTH_CHECKS")
+# psycopg 3 only prepares statements with server-side parameter binding; it
+# then caches the plan of any query run prepare_threshold (5) times per
+# connection. That helps fixed-shape ORM queries such as the due and stale
+# claim SELECTs; the batch debit/settle UPDATEs carry one placeholder group
+# per row, so their text varies with batch size and rarely gets prepared.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql" and env_bool(
+    "DB_SERVER_SIDE_BINDING"
+):
+    DATABASES["default"].setdefault("OPTIONS", {})["server_side_binding"] = True
+
+if not DEBUG and not DATABASE_URL and not get_env("DB_NAME"):
     raise ImproperlyConfigured("Set DATABASE_URL or DB_NAME when DEBUG=False")
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -113,90 +157,64 @@ REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "wallets.api.exceptions.custom_exception_handler",
 }
 
-BANK_BASE_URL = os.getenv("BANK_BASE_URL", "http://127.0.0.1:8010")
-BANK_TIMEOUT = env_float("BANK_TIMEOUT", default=3.0)
+BANK_BASE_URL = get_env("BANK_BASE_URL", "http://127.0.0.1:8010")
+BANK_TIMEOUT = env_num("BANK_TIMEOUT", 3.0, cast=float, min_=0, exclusive_min=True)
 BANK_HONORS_IDEMPOTENCY = env_bool("BANK_HONORS_IDEMPOTENCY", default=True)
-BANK_RETRY_MAX_ATTEMPTS = env_int("BANK_RETRY_MAX_ATTEMPTS", default=3)
-BANK_RETRY_BASE_DELAY = env_float("BANK_RETRY_BASE_DELAY", default=0.2)
-BANK_RETRY_MAX_DELAY = env_float("BANK_RETRY_MAX_DELAY", default=3.0)
-BANK_MAX_RPS = env_float("BANK_MAX_RPS", default=0.0)
-BANK_RATE_LIMIT_REDIS_URL = os.getenv(
+BANK_RETRY_MAX_ATTEMPTS = env_num("BANK_RETRY_MAX_ATTEMPTS", 3, cast=int, min_=1)
+BANK_RETRY_BASE_DELAY = env_num("BANK_RETRY_BASE_DELAY", 0.2, cast=float, min_=0)
+BANK_RETRY_MAX_DELAY = env_num("BANK_RETRY_MAX_DELAY", 3.0, cast=float, min_=0)
+if BANK_RETRY_MAX_DELAY < BANK_RETRY_BASE_DELAY:
+    raise ImproperlyConfigured("BANK_RETRY_MAX_DELAY must be >= BANK_RETRY_BASE_DELAY")
+BANK_MAX_RPS = env_num("BANK_MAX_RPS", 0.0, cast=float, min_=0)
+BANK_RATE_LIMIT_REDIS_URL = get_env(
     "BANK_RATE_LIMIT_REDIS_URL",
     "redis://127.0.0.1:6379/0",
 )
-BANK_RATE_LIMIT_KEY = os.getenv("BANK_RATE_LIMIT_KEY", "wallet:bank:rate_limit")
-BANK_REDIS_SOCKET_CONNECT_TIMEOUT = env_float(
-    "BANK_REDIS_SOCKET_CONNECT_TIMEOUT", default=0.5
+BANK_RATE_LIMIT_KEY = get_env("BANK_RATE_LIMIT_KEY", "wallet:bank:rate_limit")
+BANK_RATE_LIMIT_LEASE_SIZE = env_num("BANK_RATE_LIMIT_LEASE_SIZE", 1, cast=int, min_=1)
+BANK_REDIS_SOCKET_CONNECT_TIMEOUT = env_num(
+    "BANK_REDIS_SOCKET_CONNECT_TIMEOUT", 0.5, cast=float, min_=0, exclusive_min=True
 )
-BANK_REDIS_SOCKET_TIMEOUT = env_float("BANK_REDIS_SOCKET_TIMEOUT", default=0.5)
-BANK_HTTP_MAX_CONNECTIONS = env_int("BANK_HTTP_MAX_CONNECTIONS", default=10)
-BANK_HTTP_MAX_KEEPALIVE = env_int("BANK_HTTP_MAX_KEEPALIVE", default=10)
-BANK_STATUS_URL_TEMPLATE = os.getenv("BANK_STATUS_URL_TEMPLATE", "").strip()
-
-if BANK_TIMEOUT <= 0:
-    raise ImproperlyConfigured("BANK_TIMEOUT must be greater than zero")
-if BANK_RETRY_MAX_ATTEMPTS < 1:
-    raise ImproperlyConfigured("BANK_RETRY_MAX_ATTEMPTS must be >= 1")
-if BANK_RETRY_BASE_DELAY < 0:
-    raise ImproperlyConfigured("BANK_RETRY_BASE_DELAY must be >= 0")
-if BANK_RETRY_MAX_DELAY < 0:
-    raise ImproperlyConfigured("BANK_RETRY_MAX_DELAY must be >= 0")
-if BANK_RETRY_MAX_DELAY < BANK_RETRY_BASE_DELAY:
-    raise ImproperlyConfigured("BANK_RETRY_MAX_DELAY must be >= BANK_RETRY_BASE_DELAY")
-if BANK_MAX_RPS < 0:
-    raise ImproperlyConfigured("BANK_MAX_RPS must be >= 0")
-if BANK_REDIS_SOCKET_CONNECT_TIMEOUT <= 0:
-    raise ImproperlyConfigured("BANK_REDIS_SOCKET_CONNECT_TIMEOUT must be > 0")
-if BANK_REDIS_SOCKET_TIMEOUT <= 0:
-    raise ImproperlyConfigured("BANK_REDIS_SOCKET_TIMEOUT must be > 0")
-if BANK_HTTP_MAX_CONNECTIONS < 1:
-    raise ImproperlyConfigured("BANK_HTTP_MAX_CONNECTIONS must be >= 1")
-if BANK_HTTP_MAX_KEEPALIVE < 1:
-    raise ImproperlyConfigured("BANK_HTTP_MAX_KEEPALIVE must be >= 1")
-
-WITHDRAWAL_PROCESSING_STALE_SECONDS = env_int(
-    "WITHDRAWAL_PROCESSING_STALE_SECONDS", default=30
+BANK_REDIS_SOCKET_TIMEOUT = env_num(
+    "BANK_REDIS_SOCKET_TIMEOUT", 0.5, cast=float, min_=0, exclusive_min=True
+)
+BANK_HTTP_MAX_CONNECTIONS = env_num("BANK_HTTP_MAX_CONNECTIONS", 10, cast=int, min_=1)
+BANK_HTTP_MAX_KEEPALIVE = env_num("BANK_HTTP_MAX_KEEPALIVE", 10, cast=int, min_=1)
+BANK_CONCURRENCY = env_num("BANK_CONCURRENCY", 4, cast=int, min_=1)
+BANK_STATUS_URL_TEMPLATE = get_env("BANK_STATUS_URL_TEMPLATE", "").strip()
+
+WITHDRAWAL_PROCESSING_STALE_SECONDS = env_num(
+    "WITHDRAWAL_PROCESSING_STALE_SECONDS", 30, cast=int, min_=1
 )
-if WITHDRAWAL_PROCESSING_STALE_SECONDS < 1:
-    raise ImproperlyConfigured("WITHDRAWAL_PROCESSING_STALE_SECONDS must be >= 1")
-WITHDRAWAL_PROCESSING_TIMEOUT_SECONDS = env_int(
+WITHDRAWAL_PROCESSING_TIMEOUT_SECONDS = env_num(
     "WITHDRAWAL_PROCESSING_TIMEOUT_SECONDS",
-    default=WITHDRAWAL_PROCESSING_STALE_SECONDS,
+    WITHDRAWAL_PROCESSING_STALE_SECONDS,
+    cast=int,
+    min_=1,
 )
-if WITHDRAWAL_PROCESSING_TIMEOUT_SECONDS < 1:
-    raise ImproperlyConfigured("WITHDRAWAL_PROCESSING_TIMEOUT_SECONDS must be >= 1")
 
-EXECUTOR_LOCK_CONTENTION_MAX_RETRIES = env_int(
-    "EXECUTOR_LOCK_CONTENTION_MAX_RETRIES", default=20
+EXECUTOR_LOCK_CONTENTION_MAX_RETRIES = env_num(
+    "EXECUTOR_LOCK_CONTENTION_MAX_RETRIES", 20, cast=int, min_=0
 )
-if EXECUTOR_LOCK_CONTENTION_MAX_RETRIES < 0:
-    raise ImproperlyConfigured("EXECUTOR_LOCK_CONTENTION_MAX_RETRIES must be >= 0")
-
-EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS = env_float(
-    "EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS", default=0.05
+EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS = env_num(
+    "EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS", 0.05, cast=float, min_=0
+)
+EXECUTOR_LOCK_CONTENTION_BACKOFF_CAP_SECONDS = env_num(
+    "EXECUTOR_LOCK_CONTENTION_BACKOFF_CAP_SECONDS", 1.0, cast=float, min_=0
 )
-if EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS < 0:
-    raise ImproperlyConfigured("EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS must be >= 0")
-WORKER_LOOP_INTERVAL = env_float("WORKER_LOOP_INTERVAL", default=2.0)
-if WORKER_LOOP_INTERVAL < 0:
-    raise ImproperlyConfigured("WORKER_LOOP_INTERVAL must be >= 0")
-WORKER_STARTUP_JITTER_MAX = env_float("WORKER_STARTUP_JITTER_MAX", default=0.0)
-if WORKER_STARTUP_JITTER_MAX < 0:
-    raise ImproperlyConfigured("WORKER_STARTUP_JITTER_MAX must be >= 0")
-WORKER_LOOP_JITTER_MAX = env_float("WORKER_LOOP_JITTER_MAX", default=0.5)
-if WORKER_LOOP_JITTER_MAX < 0:
-    raise ImproperlyConfigured("WORKER_LOOP_JITTER_MAX must be >= 0")
-
-LOG_LEVEL = os.getenv("WALLET_LOG_LEVEL", "INFO").upper()
+WORKER_LOOP_INTERVAL = env_num("WORKER_LOOP_INTERVAL", 2.0, cast=float, min_=0)
+WORKER_STARTUP_JITTER_MAX = env_num(
+    "WORKER_STARTUP_JITTER_MAX", 0.0, cast=float, min_=0
+)
+WORKER_LOOP_JITTER_MAX = env_num("WORKER_LOOP_JITTER_MAX", 0.5, cast=float, min_=0)
+
+LOG_LEVEL = get_env("WALLET_LOG_LEVEL", "INFO").upper()
 LOGGING = {
     "version": 1,
     "disable_existing_loggers": False,
     "formatters": {
         "structured": {
-            "format": (
-                '{"ts":"%(asctime)s","level":"%(levelname)s",'
-                '"logger":"%(name)s","message":"%(message)s"}'
-            ),
+            "()": "wallet.logging.StructuredFormatter",
         },
     },
     "handlers": {
@@ -14,7 +14,7 @@ Including another URLconf
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
 
-from django.contrib import admin
+from django.apps import apps
 from django.http import JsonResponse
 from django.urls import include, path
 
@@ -24,7 +24,11 @@ def health_view(request):
 
 
 urlpatterns = [
-    path("admin/", admin.site.urls),
     path("health/", health_view),
     path("api/wallets/", include("wallets.api.urls")),
 ]
+
+if apps.is_installed("django.contrib.admin"):
+    from django.contrib import admin
+
+    urlpatterns.insert(0, path("admin/", admin.site.urls))
@@ -3,21 +3,26 @@ from rest_framework.views import exception_handler as drf_exception_handler
 
 from wallets.api.responses import api_response
 
+_STATUS_MESSAGES = {
+    status.HTTP_400_BAD_REQUEST: ("Bad request.", "درخواست نامعتبر است."),
+    status.HTTP_404_NOT_FOUND: ("Resource not found.", "منبع پیدا نشد."),
+    status.HTTP_405_METHOD_NOT_ALLOWED: ("Method not allowed.", "متد مجاز نیست."),
+}
+_SERVER_ERROR_MESSAGE = ("Internal server error.", "خطای داخلی سرور.")
+_DEFAULT_MESSAGE = ("Request failed.", "درخواست ناموفق بود.")
+
 
 def _message_for_status(status_code):
-    if status_code == status.HTTP_400_BAD_REQUEST:
-        return ("Bad request.", "درخواست نامعتبر است.")
-    if status_code == status.HTTP_404_NOT_FOUND:
-        return ("Resource not found.", "منبع پیدا نشد.")
-    if status_code == status.HTTP_405_METHOD_NOT_ALLOWED:
-        return ("Method not allowed.", "متد مجاز نیست.")
+    message = _STATUS_MESSAGES.get(status_code)
+    if message is not None:
+        return message
     if status_code >= 500:
-        return ("Internal server error.", "خطای داخلی سرور.")
-    return ("Request failed.", "درخواست ناموفق بود.")
+        return _SERVER_ERROR_MESSAGE
+    return _DEFAULT_MESSAGE
 
 
 def _normalize_detail(payload):
-    if isinstance(payload, dict) and set(payload.keys()) == {"detail"}:
+    if isinstance(payload, dict) and len(payload) == 1 and "detail" in payload:
         return payload["detail"]
     return payload
 
@@ -28,8 +33,8 @@ def custom_exception_handler(exc, context):
     if response is None:
         return api_response(
             detail=str(exc),
-            message_en="Internal server error.",
-            message_fa="خطای داخلی سرور.",
+            message_en=_SERVER_ERROR_MESSAGE[0],
+            message_fa=_SERVER_ERROR_MESSAGE[1],
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             data=None,
         )
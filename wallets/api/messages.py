@@ -0,0 +1,60 @@
+"""Bilingual ``message_en``/``message_fa`` pairs shared by the API views.
+
+Each constant is meant to be unpacked into ``api_response(**CONSTANT, ...)``.
+"""
+
+INVALID_REQUEST_BODY = {
+    "message_en": "Invalid request body.",
+    "message_fa": "درخواست نامعتبر است.",
+}
+INVALID_QUERY_PARAMETER = {
+    "message_en": "Invalid query parameter.",
+    "message_fa": "پارامتر کوئری نامعتبر است.",
+}
+INVALID_QUERY_PARAMETERS = {
+    "message_en": "Invalid query parameters.",
+    "message_fa": "پارامترهای کوئری نامعتبر هستند.",
+}
+WALLET_NOT_FOUND = {
+    "message_en": "Wallet was not found.",
+    "message_fa": "کیف پول پیدا نشد.",
+}
+IDEMPOTENCY_CONFLICT = {
+    "message_en": "Idempotency key already used for another request.",
+    "message_fa": "کلید یکتایی برای درخواست دیگری استفاده شده است.",
+}
+
+INVALID_DEPOSIT = {
+    "message_en": "Invalid deposit request.",
+    "message_fa": "درخواست واریز نامعتبر است.",
+}
+DEPOSIT_COMPLETED = {
+    "message_en": "Deposit completed successfully.",
+    "message_fa": "واریز با موفقیت انجام شد.",
+}
+DEPOSIT_REPLAYED = {
+    "message_en": "Deposit request already accepted.",
+    "message_fa": "درخواست واریز قبلا ثبت شده است.",
+}
+
+INVALID_WITHDRAWAL = {
+    "message_en": "Invalid withdrawal request.",
+    "message_fa": "درخواست برداشت نامعتبر است.",
+}
+WITHDRAWAL_SCHEDULED = {
+    "message_en": "Withdrawal was scheduled successfully.",
+    "message_fa": "برداشت با موفقیت زمان بندی شد.",
+}
+WITHDRAWAL_REPLAYED = {
+    "message_en": "Withdrawal request already accepted.",
+    "message_fa": "درخواست برداشت قبلا ثبت شده است.",
+}
+
+WALLET_DETAILS_FETCHED = {
+    "message_en": "Wallet details retrieved successfully.",
+    "message_fa": "جزئیات کیف پول با موفقیت دریافت شد.",
+}
+WALLET_TRANSACTIONS_FETCHED = {
+    "message_en": "Wallet transactions retrieved successfully.",
+    "message_fa": "تراکنش های کیف پول با موفقیت دریافت شد.",
+}
@@ -2,12 +2,32 @@ from rest_framework import serializers
 
 from wallets.models import Transaction, Wallet
 
+WALLET_FIELDS = ("id", "uuid", "balance", "created_at", "updated_at")
+TRANSACTION_FIELDS = (
+    "id",
+    "wallet_id",
+    "type",
+    "status",
+    "amount",
+    "execute_at",
+    "idempotency_key",
+    "external_reference",
+    "bank_reference",
+    "failure_reason",
+    "created_at",
+    "updated_at",
+)
+
+_TRANSACTION_TYPES = frozenset(Transaction.Type.values)
+_TRANSACTION_STATUSES = frozenset(Transaction.Status.values)
+_INVALID_CHOICE = serializers.ChoiceField.default_error_messages["invalid_choice"]
+
 
 class WalletSerializer(serializers.ModelSerializer):
     class Meta:
         model = Wallet
-        fields = ("id", "uuid", "balance", "created_at", "updated_at")
-        read_only_fields = ("id", "uuid", "balance", "created_at", "updated_at")
+        fields = WALLET_FIELDS
+        read_only_fields = WALLET_FIELDS
 
 
 class DepositRequestSerializer(serializers.Serializer):
@@ -32,28 +52,28 @@ class ScheduleWithdrawalRequestSerializer(serializers.Serializer):
 class TransactionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Transaction
-        fields = (
-            "id",
-            "wallet_id",
-            "type",
-            "status",
-            "amount",
-            "execute_at",
-            "idempotency_key",
-            "external_reference",
-            "bank_reference",
-            "failure_reason",
-            "created_at",
-            "updated_at",
-        )
+        fields = TRANSACTION_FIELDS
+        read_only_fields = TRANSACTION_FIELDS
 
 
 class TransactionFilterSerializer(serializers.Serializer):
-    type = serializers.ChoiceField(
-        choices=Transaction.Type.values,
+    type = serializers.CharField(
         required=False,
+        allow_blank=True,
+        trim_whitespace=False,
     )
-    status = serializers.ChoiceField(
-        choices=Transaction.Status.values,
+    status = serializers.CharField(
         required=False,
+        allow_blank=True,
+        trim_whitespace=False,
     )
+
+    def validate_type(self, value):
+        if value not in _TRANSACTION_TYPES:
+            raise serializers.ValidationError(_INVALID_CHOICE.format(input=value))
+        return value
+
+    def validate_status(self, value):
+        if value not in _TRANSACTION_STATUSES:
+            raise serializers.ValidationError(_INVALID_CHOICE.format(input=value))
+        return value
@@ -1,8 +1,11 @@
 from rest_framework import status as http_status
 from rest_framework.views import APIView
 
+from wallets.api import messages
 from wallets.api.responses import api_response
 from wallets.api.serializers import (
+    TRANSACTION_FIELDS,
+    WALLET_FIELDS,
     DepositRequestSerializer,
     ScheduleWithdrawalRequestSerializer,
     TransactionFilterSerializer,
@@ -19,9 +22,14 @@ from wallets.domain.exceptions import (
 from wallets.domain.services import WalletService, WithdrawalService
 from wallets.models import Transaction, Wallet
 
+# Read-only serializers are stateless once their fields are bound, so share one
+# instance of each instead of rebuilding the field set on every request.
+_WALLET_SERIALIZER = WalletSerializer()
+_TRANSACTION_SERIALIZER = TransactionSerializer()
+
 
 def get_wallet_or_none(wallet_id):
-    return Wallet.objects.filter(pk=wallet_id).first()
+    return Wallet.objects.only(*WALLET_FIELDS).filter(pk=wallet_id).first()
 
 
 class WalletDepositAPIView(APIView):
@@ -30,8 +38,7 @@ class WalletDepositAPIView(APIView):
         if not serializer.is_valid():
             return api_response(
                 detail=serializer.errors,
-                message_en="Invalid request body.",
-                message_fa="درخواست نامعتبر است.",
+                **messages.INVALID_REQUEST_BODY,
                 status_code=http_status.HTTP_400_BAD_REQUEST,
                 data=None,
             )
@@ -42,8 +49,7 @@ class WalletDepositAPIView(APIView):
             if body_idempotency_key != header_idempotency_key:
                 return api_response(
                     detail="idempotency key mismatch between header and body",
-                    message_en="Invalid deposit request.",
-                    message_fa="درخواست واریز نامعتبر است.",
+                    **messages.INVALID_DEPOSIT,
                     status_code=http_status.HTTP_400_BAD_REQUEST,
                     data=None,
                 )
@@ -59,47 +65,41 @@ class WalletDepositAPIView(APIView):
         except WalletNotFound:
             return api_response(
                 detail=f"wallet={wallet_id} not found",
-                message_en="Wallet was not found.",
-                message_fa="کیف پول پیدا نشد.",
+                **messages.WALLET_NOT_FOUND,
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 data=None,
             )
         except (InvalidAmount, InvalidIdempotencyKey) as exc:
             return api_response(
                 detail=str(exc),
-                message_en="Invalid deposit request.",
-                message_fa="درخواست واریز نامعتبر است.",
+                **messages.INVALID_DEPOSIT,
                 status_code=http_status.HTTP_400_BAD_REQUEST,
                 data=None,
             )
         except IdempotencyConflict as exc:
             return api_response(
                 detail=str(exc),
-                message_en="Idempotency key already used for another request.",
-                message_fa="کلید یکتایی برای درخواست دیگری استفاده شده است.",
+                **messages.IDEMPOTENCY_CONFLICT,
                 status_code=http_status.HTTP_409_CONFLICT,
                 data=None,
             )
 
         payload = {
-            "wallet": WalletSerializer(tx.wallet).data,
-            "transaction": TransactionSerializer(tx).data,
+            "wallet": _WALLET_SERIALIZER.to_representation(tx.wallet),
+            "transaction": _TRANSACTION_SERIALIZER.to_representation(tx),
         }
         if created:
             detail = "Deposit transaction created."
-            message_en = "Deposit completed successfully."
-            message_fa = "واریز با موفقیت انجام شد."
+            message = messages.DEPOSIT_COMPLETED
             status_code = http_status.HTTP_201_CREATED
         else:
             detail = "Deposit request already exists for this idempotency key."
-            message_en = "Deposit request already accepted."
-            message_fa = "درخواست واریز قبلا ثبت شده است."
+            message = messages.DEPOSIT_REPLAYED
             status_code = http_status.HTTP_200_OK
 
         return api_response(
             detail=detail,
-            message_en=message_en,
-            message_fa=message_fa,
+            **message,
             status_code=status_code,
             data=payload,
         )
@@ -111,8 +111,7 @@ class WalletWithdrawalScheduleAPIView(APIView):
         if not serializer.is_valid():
             return api_response(
                 detail=serializer.errors,
-                message_en="Invalid request body.",
-                message_fa="درخواست نامعتبر است.",
+                **messages.INVALID_REQUEST_BODY,
                 status_code=http_status.HTTP_400_BAD_REQUEST,
                 data=None,
             )
@@ -123,8 +122,7 @@ class WalletWithdrawalScheduleAPIView(APIView):
             if body_idempotency_key != header_idempotency_key:
                 return api_response(
                     detail="idempotency key mismatch between header and body",
-                    message_en="Invalid withdrawal request.",
-                    message_fa="درخواست برداشت نامعتبر است.",
+                    **messages.INVALID_WITHDRAWAL,
                     status_code=http_status.HTTP_400_BAD_REQUEST,
                     data=None,
                 )
@@ -141,47 +139,41 @@ class WalletWithdrawalScheduleAPIView(APIView):
         except WalletNotFound:
             return api_response(
                 detail=f"wallet={wallet_id} not found",
-                message_en="Wallet was not found.",
-                message_fa="کیف پول پیدا نشد.",
+                **messages.WALLET_NOT_FOUND,
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 data=None,
             )
         except (InvalidAmount, InvalidExecuteAt, InvalidIdempotencyKey) as exc:
             return api_response(
                 detail=str(exc),
-                message_en="Invalid withdrawal request.",
-                message_fa="درخواست برداشت نامعتبر است.",
+                **messages.INVALID_WITHDRAWAL,
                 status_code=http_status.HTTP_400_BAD_REQUEST,
                 data=None,
             )
         except IdempotencyConflict as exc:
             return api_response(
                 detail=str(exc),
-                message_en="Idempotency key already used for another request.",
-                message_fa="کلید یکتایی برای درخواست دیگری استفاده شده است.",
+                **messages.IDEMPOTENCY_CONFLICT,
                 status_code=http_status.HTTP_409_CONFLICT,
                 data=None,
             )
 
         payload = {
-            "wallet": WalletSerializer(tx.wallet).data,
-            "transaction": TransactionSerializer(tx).data,
+            "wallet": _WALLET_SERIALIZER.to_representation(tx.wallet),
+            "transaction": _TRANSACTION_SERIALIZER.to_representation(tx),
         }
         if created:
             detail = "Withdrawal scheduled."
-            message_en = "Withdrawal was scheduled successfully."
-            message_fa = "برداشت با موفقیت زمان بندی شد."
+            message = messages.WITHDRAWAL_SCHEDULED
             status_code = http_status.HTTP_201_CREATED
         else:
             detail = "Withdrawal request already exists for this idempotency key."
-            message_en = "Withdrawal request already accepted."
-            message_fa = "درخواست برداشت قبلا ثبت شده است."
+            message = messages.WITHDRAWAL_REPLAYED
             status_code = http_status.HTTP_200_OK
 
         return api_response(
             detail=detail,
-            message_en=message_en,
-            message_fa=message_fa,
+            **message,
             status_code=status_code,
             data=payload,
         )
@@ -193,8 +185,7 @@ class WalletDetailAPIView(APIView):
         if wallet is None:
             return api_response(
                 detail=f"wallet={wallet_id} not found",
-                message_en="Wallet was not found.",
-                message_fa="کیف پول پیدا نشد.",
+                **messages.WALLET_NOT_FOUND,
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 data=None,
             )
@@ -202,35 +193,40 @@ class WalletDetailAPIView(APIView):
         recent_limit = 10
         recent_value = request.query_params.get("recent")
         if recent_value is not None:
-            try:
-                recent_limit = int(recent_value)
-            except ValueError:
+            digits = recent_value.removeprefix("-")
+            if not (digits.isascii() and digits.isdigit()):
                 return api_response(
                     detail="recent must be an integer",
-                    message_en="Invalid query parameter.",
-                    message_fa="پارامتر کوئری نامعتبر است.",
+                    **messages.INVALID_QUERY_PARAMETER,
                     status_code=http_status.HTTP_400_BAD_REQUEST,
                     data=None,
                 )
 
+            # More than three digits is out of range anyway; checking the length
+            # first also keeps int() clear of its 4300-digit ValueError.
+            recent_limit = int(recent_value) if len(digits.lstrip("0")) <= 3 else 0
             if recent_limit < 1 or recent_limit > 100:
                 return api_response(
                     detail="recent must be between 1 and 100",
-                    message_en="Invalid query parameter.",
-                    message_fa="پارامتر کوئری نامعتبر است.",
+                    **messages.INVALID_QUERY_PARAMETER,
                     status_code=http_status.HTTP_400_BAD_REQUEST,
                     data=None,
                 )
 
-        transactions = wallet.transactions.order_by("-created_at")[:recent_limit]
+        transactions = wallet.transactions.order_by("-created_at").values(
+            *TRANSACTION_FIELDS
+        )[:recent_limit]
+        # values() rows go through the serializer's fields, so datetimes get
+        # the same timezone conversion and format as serialized instances.
         payload = {
-            "wallet": WalletSerializer(wallet).data,
-            "recent_transactions": TransactionSerializer(transactions, many=True).data,
+            "wallet": _WALLET_SERIALIZER.to_representation(wallet),
+            "recent_transactions": [
+                _TRANSACTION_SERIALIZER.to_representation(row) for row in transactions
+            ],
         }
         return api_response(
             detail="Wallet details fetched.",
-            message_en="Wallet details retrieved successfully.",
-            message_fa="جزئیات کیف پول با موفقیت دریافت شد.",
+            **messages.WALLET_DETAILS_FETCHED,
             status_code=http_status.HTTP_200_OK,
             data=payload,
         )
@@ -242,44 +238,44 @@ class WalletTransactionsAPIView(APIView):
         if wallet is None:
             return api_response(
                 detail=f"wallet={wallet_id} not found",
-                message_en="Wallet was not found.",
-                message_fa="کیف پول پیدا نشد.",
+                **messages.WALLET_NOT_FOUND,
                 status_code=http_status.HTTP_404_NOT_FOUND,
                 data=None,
             )
 
-        filter_serializer = TransactionFilterSerializer(data=request.query_params)
-        if not filter_serializer.is_valid():
-            return api_response(
-                detail=filter_serializer.errors,
-                message_en="Invalid query parameters.",
-                message_fa="پارامترهای کوئری نامعتبر هستند.",
-                status_code=http_status.HTTP_400_BAD_REQUEST,
-                data=None,
-            )
-
         filters = {}
-        tx_type = filter_serializer.validated_data.get("type")
-        tx_status = filter_serializer.validated_data.get("status")
+        if request.query_params:
+            filter_serializer = TransactionFilterSerializer(data=request.query_params)
+            if not filter_serializer.is_valid():
+                return api_response(
+                    detail=filter_serializer.errors,
+                    **messages.INVALID_QUERY_PARAMETERS,
+                    status_code=http_status.HTTP_400_BAD_REQUEST,
+                    data=None,
+                )
+
+            tx_type = filter_serializer.validated_data.get("type")
+            tx_status = filter_serializer.validated_data.get("status")
 
-        if tx_type:
-            filters["type"] = tx_type
-        if tx_status:
-            filters["status"] = tx_status
+            if tx_type:
+                filters["type"] = tx_type
+            if tx_status:
+                filters["status"] = tx_status
 
-        transactions = Transaction.objects.filter(
-            wallet_id=wallet.id, **filters
-        ).order_by("-created_at")
+        rows = list(
+            Transaction.objects.filter(wallet_id=wallet.id, **filters)
+            .order_by("-created_at")
+            .values(*TRANSACTION_FIELDS)
+        )
 
         payload = {
-            "wallet": WalletSerializer(wallet).data,
-            "count": transactions.count(),
-            "results": TransactionSerializer(transactions, many=True).data,
+            "wallet": _WALLET_SERIALIZER.to_representation(wallet),
+            "count": len(rows),
+            "results": [_TRANSACTION_SERIALIZER.to_representation(row) for row in rows],
         }
         return api_response(
             detail="Wallet transactions fetched.",
-            message_en="Wallet transactions retrieved successfully.",
-            message_fa="تراکنش های کیف پول با موفقیت دریافت شد.",
+            **messages.WALLET_TRANSACTIONS_FETCHED,
             status_code=http_status.HTTP_200_OK,
             data=payload,
         )
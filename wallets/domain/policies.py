@@ -1,12 +1,13 @@
-from datetime import datetime
-
-from django.utils import timezone
+from datetime import datetime, timezone
 
 from wallets.domain.exceptions import InvalidAmount, InvalidExecuteAt
 
+_UTC = timezone.utc
+
 
 def validate_positive_amount(amount):
-    if isinstance(amount, bool) or not isinstance(amount, int):
+    # Exact type check: rejects bool (an int subclass) without a second call.
+    if type(amount) is not int:
         raise InvalidAmount("amount must be a positive integer in minor units")
 
     if amount <= 0:
@@ -19,10 +20,10 @@ def validate_future_execute_at(execute_at, now=None):
     if not isinstance(execute_at, datetime):
         raise InvalidExecuteAt("execute_at must be a datetime")
 
-    if timezone.is_naive(execute_at):
+    if execute_at.utcoffset() is None:
         raise InvalidExecuteAt("execute_at must be timezone-aware")
 
-    now_value = now or timezone.now()
+    now_value = now or datetime.now(_UTC)
     if execute_at <= now_value:
         raise InvalidExecuteAt("execute_at must be in the future")
 
@@ -1,7 +1,7 @@
 import logging
 
-from django.db import transaction
-from django.db.models import F
+from django.db import connection, transaction
+from django.db.models import BigIntegerField, Case, F, Value, When
 from django.utils import timezone
 
 from wallets.domain.exceptions import (
@@ -16,14 +16,83 @@ from wallets.integrations.bank_client import (
     TransferOutcome,
     TransferResult,
 )
-from wallets.integrations.idempotency import (
-    ensure_transaction_idempotency_key,
-    generate_idempotency_key,
-)
+from wallets.integrations.idempotency import generate_idempotency_key
 from wallets.models import Transaction, Wallet, WithdrawalReconciliationTask
 
 logger = logging.getLogger(__name__)
 
+# Bound once at import: these are read on every service call.
+_DEPOSIT = Transaction.Type.DEPOSIT
+_WITHDRAWAL = Transaction.Type.WITHDRAWAL
+_SCHEDULED = Transaction.Status.SCHEDULED
+_PROCESSING = Transaction.Status.PROCESSING
+_UNKNOWN = Transaction.Status.UNKNOWN
+_SUCCEEDED = Transaction.Status.SUCCEEDED
+_FAILED = Transaction.Status.FAILED
+
+# Columns execute_withdrawal reads; everything it writes goes through
+# _update_transaction, so the remaining columns are never loaded.
+_EXECUTION_FIELDS = (
+    "wallet",
+    "type",
+    "status",
+    "amount",
+    "execute_at",
+    "idempotency_key",
+)
+
+
+def _credit_wallet(wallet_id, amount):
+    """Atomically add ``amount`` to the wallet and return the updated row.
+
+    Returns ``None`` when the wallet does not exist.
+    """
+    quote_name = connection.ops.quote_name
+    balance = quote_name("balance")
+    sql = (
+        f"UPDATE {quote_name(Wallet._meta.db_table)} "
+        f"SET {balance} = {balance} + %s "
+        f"WHERE {quote_name('id')} = %s RETURNING *"
+    )
+    return next(iter(Wallet.objects.raw(sql, [amount, wallet_id])), None)
+
+
+def _update_transaction(tx, *, from_status=None, **changes):
+    """Persist ``changes`` with a single UPDATE and mirror them onto ``tx``.
+
+    With ``from_status`` the row is only written while it still has that
+    status. Returns whether the row was updated. Bypasses ``Model.save()``, so
+    ``updated_at`` is set explicitly.
+    """
+    changes["updated_at"] = timezone.now()
+    queryset = Transaction.objects.filter(pk=tx.pk)
+    if from_status is not None:
+        queryset = queryset.filter(status=from_status)
+    if not queryset.update(**changes):
+        return False
+    for name, value in changes.items():
+        setattr(tx, name, value)
+    return True
+
+
+def _insert_unless_key_exists(tx):
+    """INSERT ``tx`` unless its idempotency_key is already taken.
+
+    Returns the stored row, or ``None`` when another row owns the key. The
+    unique index arbitrates concurrent requests in a single statement.
+    """
+    quote_name = connection.ops.quote_name
+    fields = [f for f in Transaction._meta.concrete_fields if not f.primary_key]
+    columns = ", ".join(quote_name(f.column) for f in fields)
+    placeholders = ", ".join(["%s"] * len(fields))
+    params = [f.get_db_prep_save(f.pre_save(tx, True), connection) for f in fields]
+    sql = (
+        f"INSERT INTO {quote_name(Transaction._meta.db_table)} ({columns}) "
+        f"VALUES ({placeholders}) "
+        f"ON CONFLICT ({quote_name('idempotency_key')}) DO NOTHING RETURNING *"
+    )
+    return next(iter(Transaction.objects.raw(sql, params)), None)
+
 
 class WalletService:
     @staticmethod
@@ -31,21 +100,15 @@ class WalletService:
         validated_amount = validate_positive_amount(amount)
 
         with transaction.atomic():
-            try:
-                wallet = Wallet.objects.select_for_update().get(pk=wallet_id)
-            except Wallet.DoesNotExist as exc:
-                raise WalletNotFound(f"wallet={wallet_id} does not exist") from exc
-
             if idempotency_key is None:
-                Wallet.objects.filter(pk=wallet.pk).update(
-                    balance=F("balance") + validated_amount
-                )
-                wallet.refresh_from_db(fields=["balance", "updated_at"])
+                wallet = _credit_wallet(wallet_id, validated_amount)
+                if wallet is None:
+                    raise WalletNotFound(f"wallet={wallet_id} does not exist")
 
                 tx = Transaction.objects.create(
                     wallet=wallet,
-                    type=Transaction.Type.DEPOSIT,
-                    status=Transaction.Status.SUCCEEDED,
+                    type=_DEPOSIT,
+                    status=_SUCCEEDED,
                     amount=validated_amount,
                 )
                 if include_created:
@@ -56,33 +119,90 @@ class WalletService:
             if not normalized_idempotency_key:
                 raise InvalidIdempotencyKey("idempotency_key cannot be empty")
 
-            tx, created = Transaction.objects.get_or_create(
-                idempotency_key=normalized_idempotency_key,
-                defaults={
-                    "wallet": wallet,
-                    "type": Transaction.Type.DEPOSIT,
-                    "status": Transaction.Status.SUCCEEDED,
-                    "amount": validated_amount,
-                },
+            tx = _insert_unless_key_exists(
+                Transaction(
+                    idempotency_key=normalized_idempotency_key,
+                    wallet_id=wallet_id,
+                    type=_DEPOSIT,
+                    status=_SUCCEEDED,
+                    amount=validated_amount,
+                )
             )
+            created = tx is not None
             if created:
-                Wallet.objects.filter(pk=wallet.pk).update(
-                    balance=F("balance") + validated_amount
-                )
-                wallet.refresh_from_db(fields=["balance", "updated_at"])
-            elif (
-                tx.type != Transaction.Type.DEPOSIT
-                or tx.wallet_id != wallet.id
-                or tx.amount != validated_amount
-            ):
-                raise IdempotencyConflict(
-                    "idempotency_key already used with a different deposit payload"
-                )
+                # The credit also proves the wallet exists; raising here rolls
+                # back the transaction row inserted above.
+                wallet = _credit_wallet(wallet_id, validated_amount)
+                if wallet is None:
+                    raise WalletNotFound(f"wallet={wallet_id} does not exist")
+            else:
+                tx = Transaction.objects.get(idempotency_key=normalized_idempotency_key)
+                wallet = Wallet.objects.filter(pk=wallet_id).first()
+                if wallet is None:
+                    raise WalletNotFound(f"wallet={wallet_id} does not exist")
+                if (
+                    tx.type != _DEPOSIT
+                    or tx.wallet_id != wallet.id
+                    or tx.amount != validated_amount
+                ):
+                    raise IdempotencyConflict(
+                        "idempotency_key already used with a different deposit payload"
+                    )
 
+            tx.wallet = wallet
             if include_created:
                 return tx, created
             return tx
 
+    @staticmethod
+    def deposit_many(items):
+        """Credit several ``(wallet_id, amount)`` deposits in two statements.
+
+        All wallets are updated with one CASE-based UPDATE and all transactions
+        are written with one bulk INSERT. If any wallet is missing, nothing is
+        applied.
+        """
+        deposits = [
+            (wallet_id, validate_positive_amount(amount)) for wallet_id, amount in items
+        ]
+        if not deposits:
+            return []
+
+        totals = {}
+        for wallet_id, amount in deposits:
+            totals[wallet_id] = totals.get(wallet_id, 0) + amount
+
+        with transaction.atomic():
+            updated = Wallet.objects.filter(pk__in=totals).update(
+                balance=F("balance")
+                + Case(
+                    *(
+                        When(pk=wallet_id, then=Value(total))
+                        for wallet_id, total in totals.items()
+                    ),
+                    output_field=BigIntegerField(),
+                )
+            )
+            if updated != len(totals):
+                existing = set(
+                    Wallet.objects.filter(pk__in=totals).values_list("pk", flat=True)
+                )
+                missing = sorted(totals.keys() - existing)
+                raise WalletNotFound(f"wallet={missing[0]} does not exist")
+
+            return Transaction.objects.bulk_create(
+                [
+                    Transaction(
+                        wallet_id=wallet_id,
+                        type=_DEPOSIT,
+                        status=_SUCCEEDED,
+                        amount=amount,
+                    )
+                    for wallet_id, amount in deposits
+                ],
+                batch_size=500,
+            )
+
 
 class WithdrawalService:
     @staticmethod
@@ -105,8 +225,8 @@ class WithdrawalService:
         if idempotency_key is None:
             tx = Transaction.objects.create(
                 wallet=wallet,
-                type=Transaction.Type.WITHDRAWAL,
-                status=Transaction.Status.SCHEDULED,
+                type=_WITHDRAWAL,
+                status=_SCHEDULED,
                 amount=validated_amount,
                 execute_at=validated_execute_at,
                 idempotency_key=generate_idempotency_key(),
@@ -119,20 +239,21 @@ class WithdrawalService:
         if not normalized_idempotency_key:
             raise InvalidIdempotencyKey("idempotency_key cannot be empty")
 
-        tx, created = Transaction.objects.get_or_create(
-            idempotency_key=normalized_idempotency_key,
-            defaults={
-                "wallet": wallet,
-                "type": Transaction.Type.WITHDRAWAL,
-                "status": Transaction.Status.SCHEDULED,
-                "amount": validated_amount,
-                "execute_at": validated_execute_at,
-            },
+        tx = _insert_unless_key_exists(
+            Transaction(
+                idempotency_key=normalized_idempotency_key,
+                wallet=wallet,
+                type=_WITHDRAWAL,
+                status=_SCHEDULED,
+                amount=validated_amount,
+                execute_at=validated_execute_at,
+            )
         )
-
+        created = tx is not None
         if not created:
+            tx = Transaction.objects.get(idempotency_key=normalized_idempotency_key)
             if (
-                tx.type != Transaction.Type.WITHDRAWAL
+                tx.type != _WITHDRAWAL
                 or tx.wallet_id != wallet.id
                 or tx.amount != validated_amount
                 or tx.execute_at != validated_execute_at
@@ -140,6 +261,7 @@ class WithdrawalService:
                 raise IdempotencyConflict(
                     "idempotency_key already used with a different withdrawal payload"
                 )
+        tx.wallet = wallet
 
         if include_created:
             return tx, created
@@ -151,9 +273,12 @@ class WithdrawalService:
 
         with transaction.atomic():
             try:
+                # Lock only the transaction row; the wallet uuid is read
+                # unlocked and the debit below takes the wallet row lock.
                 tx = (
-                    Transaction.objects.select_for_update()
+                    Transaction.objects.select_for_update(of=("self",))
                     .select_related("wallet")
+                    .only(*_EXECUTION_FIELDS, "wallet__uuid")
                     .get(pk=transaction_id)
                 )
             except Transaction.DoesNotExist as exc:
@@ -161,41 +286,36 @@ class WithdrawalService:
                     f"transaction={transaction_id} does not exist"
                 ) from exc
 
-            if tx.type != Transaction.Type.WITHDRAWAL:
+            if tx.type != _WITHDRAWAL:
                 raise InvalidTransactionState(
                     "only withdrawal transactions can be executed"
                 )
 
-            if tx.status != Transaction.Status.SCHEDULED:
+            if tx.status != _SCHEDULED:
                 raise InvalidTransactionState(
-                    f"transaction status must be {Transaction.Status.SCHEDULED}, got={tx.status}"
+                    f"transaction status must be {_SCHEDULED}, got={tx.status}"
                 )
             if tx.execute_at and tx.execute_at > timezone.now():
                 raise InvalidTransactionState(
                     "transaction execute_at is in the future and cannot be executed yet"
                 )
 
-            wallet = Wallet.objects.select_for_update().get(pk=tx.wallet_id)
+            # The conditional UPDATE checks the balance and takes the wallet row
+            # lock in one statement, so the wallet is not selected first.
             debited = Wallet.objects.filter(
-                pk=wallet.pk,
+                pk=tx.wallet_id,
                 balance__gte=tx.amount,
             ).update(balance=F("balance") - tx.amount)
             if debited == 0:
-                tx.status = Transaction.Status.FAILED
-                tx.failure_reason = "insufficient_balance"
-                tx.save(update_fields=["status", "failure_reason", "updated_at"])
+                _update_transaction(
+                    tx, status=_FAILED, failure_reason="insufficient_balance"
+                )
                 return tx
 
-            tx.idempotency_key = ensure_transaction_idempotency_key(tx)
-            tx.status = Transaction.Status.PROCESSING
-            tx.failure_reason = None
-            tx.save(
-                update_fields=[
-                    "idempotency_key",
-                    "status",
-                    "failure_reason",
-                    "updated_at",
-                ]
+            _update_transaction(
+                tx,
+                status=_PROCESSING,
+                failure_reason=None,
             )
 
         try:
@@ -215,46 +335,45 @@ class WithdrawalService:
                 error_reason=f"gateway_exception:{exc.__class__.__name__}",
             )
 
+        if transfer_result.outcome == TransferOutcome.SUCCESS:
+            changes = {
+                "status": _SUCCEEDED,
+                "external_reference": transfer_result.reference,
+                "bank_reference": transfer_result.reference,
+                "failure_reason": None,
+            }
+        elif transfer_result.outcome == TransferOutcome.UNKNOWN:
+            changes = {
+                "status": _UNKNOWN,
+                "failure_reason": transfer_result.error_reason or "UNKNOWN_TRANSFER",
+            }
+        else:
+            changes = {
+                "status": _FAILED,
+                "failure_reason": transfer_result.error_reason
+                or "bank_transfer_failed",
+            }
+
         with transaction.atomic():
-            tx = (
-                Transaction.objects.select_for_update()
-                .select_related("wallet")
-                .get(pk=transaction_id)
-            )
-            wallet = Wallet.objects.select_for_update().get(pk=tx.wallet_id)
-            if tx.status != Transaction.Status.PROCESSING:
+            # The status-guarded UPDATE locks the row and re-checks its state in
+            # one statement, so the row is not re-selected before settling.
+            if not _update_transaction(tx, from_status=_PROCESSING, **changes):
+                current_status = (
+                    Transaction.objects.filter(pk=transaction_id)
+                    .values_list("status", flat=True)
+                    .first()
+                )
                 raise InvalidTransactionState(
-                    f"transaction status must be {Transaction.Status.PROCESSING}, got={tx.status}"
+                    f"transaction status must be {_PROCESSING}, got={current_status}"
                 )
 
-            if transfer_result.outcome == TransferOutcome.SUCCESS:
-                tx.status = Transaction.Status.SUCCEEDED
-                tx.external_reference = transfer_result.reference
-                tx.bank_reference = transfer_result.reference
-                tx.failure_reason = None
-                tx.save(
-                    update_fields=[
-                        "status",
-                        "external_reference",
-                        "bank_reference",
-                        "failure_reason",
-                        "updated_at",
-                    ]
-                )
-                return tx
-
             if transfer_result.outcome == TransferOutcome.UNKNOWN:
-                tx.status = Transaction.Status.UNKNOWN
-                tx.failure_reason = transfer_result.error_reason or "UNKNOWN_TRANSFER"
-                tx.save(update_fields=["status", "failure_reason", "updated_at"])
                 WithdrawalReconciliationTask.objects.get_or_create(
                     transaction=tx,
                     defaults={"reason": "UNKNOWN_TRANSFER_OUTCOME"},
                 )
-                return tx
-
-            Wallet.objects.filter(pk=wallet.pk).update(balance=F("balance") + tx.amount)
-            tx.status = Transaction.Status.FAILED
-            tx.failure_reason = transfer_result.error_reason or "bank_transfer_failed"
-            tx.save(update_fields=["status", "failure_reason", "updated_at"])
-            return tx
+            elif transfer_result.outcome != TransferOutcome.SUCCESS:
+                Wallet.objects.filter(pk=tx.wallet_id).update(
+                    balance=F("balance") + tx.amount
+                )
+        return tx
@@ -1,4 +1,5 @@
 import logging
+import string
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -21,7 +22,37 @@ class TransferOutcome(str, Enum):
     UNKNOWN = "UNKNOWN"
 
 
-@dataclass(frozen=True)
+_OUTCOMES_BY_VALUE = {member.value: member for member in TransferOutcome}
+_STATUS_URL_FIELDS = frozenset({"idempotency_key", "reference"})
+
+
+def _compile_status_url(template):
+    """Parse ``BANK_STATUS_URL_TEMPLATE`` once into a ``%``-style formatter.
+
+    Templates using conversions, format specs or other field names keep the
+    ``str.format`` behaviour.
+    """
+    pieces = []
+    try:
+        parsed = list(string.Formatter().parse(template))
+    except ValueError:
+        return template.format
+    for literal, field, spec, conversion in parsed:
+        pieces.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if field not in _STATUS_URL_FIELDS or spec or conversion:
+            return template.format
+        pieces.append(f"%({field})s")
+    compiled = "".join(pieces)
+
+    def format_status_url(**fields):
+        return compiled % fields
+
+    return format_status_url
+
+
+@dataclass(frozen=True, slots=True)
 class TransferResult:
     outcome: TransferOutcome
     reference: str | None = None
@@ -29,8 +60,13 @@ class TransferResult:
     retry_after_seconds: float | None = None
 
     def __post_init__(self):
-        if not isinstance(self.outcome, TransferOutcome):
-            object.__setattr__(self, "outcome", TransferOutcome(self.outcome))
+        outcome = self.outcome
+        if type(outcome) is not TransferOutcome:
+            object.__setattr__(
+                self,
+                "outcome",
+                _OUTCOMES_BY_VALUE.get(outcome) or TransferOutcome(outcome),
+            )
 
     @property
     def success(self):
@@ -73,6 +109,7 @@ class TransferResult:
 class BankGateway:
     def __init__(self, *, base_url=None, http_client=None, rate_limiter=None):
         self.base_url = (base_url or settings.BANK_BASE_URL).rstrip("/")
+        self.transfer_url = f"{self.base_url}/"
         self.http_client = http_client or HttpClient(
             connect_timeout=settings.BANK_TIMEOUT,
             read_timeout=settings.BANK_TIMEOUT,
@@ -84,8 +121,21 @@ class BankGateway:
         self.base_delay = settings.BANK_RETRY_BASE_DELAY
         self.max_delay = settings.BANK_RETRY_MAX_DELAY
         self.status_url_template = settings.BANK_STATUS_URL_TEMPLATE
+        self._format_status_url = _compile_status_url(self.status_url_template)
         self.rate_limiter = rate_limiter or build_rate_limiter()
 
+    def warmup(self, *, connections=None):
+        if connections is None:
+            connections = settings.BANK_CONCURRENCY
+        warmed = self.http_client.warmup(self.transfer_url, connections=connections)
+        logger.info(
+            "event=bank_pool_warmup worker_role=sender base_url=%s requested=%s warmed=%s",
+            self.base_url,
+            connections,
+            warmed,
+        )
+        return warmed
+
     def _acquire_rate_limit(self, *, idempotency_key, transfer_id):
         try:
             acquire_result = self.rate_limiter.acquire(cost=1)
@@ -101,10 +151,12 @@ class BankGateway:
         wait_ms = int(wait_seconds * 1000)
         if wait_ms > 0:
             logger.warning(
-                "event=bank_rate_limit_wait worker_role=sender transfer_id=%s idempotency_key=%s limiter_wait_ms=%s",
+                "event=bank_rate_limit_wait worker_role=sender transfer_id=%s idempotency_key=%s limiter_wait_ms=%s limiter_tokens=%s limiter_capacity=%s",
                 transfer_id,
                 idempotency_key,
                 wait_ms,
+                acquire_result.tokens_remaining,
+                acquire_result.capacity,
             )
         return wait_seconds
 
@@ -127,22 +179,22 @@ class BankGateway:
         transfer_id=None,
     ):
         transfer_id = transfer_id or idempotency_key
-        logger.info(
-            "event=bank_transfer_request worker_role=sender transfer_id=%s idempotency_key=%s wallet_owner_ref=%s amount=%s",
-            transfer_id,
-            idempotency_key,
-            wallet_owner_ref,
-            amount,
-        )
+        # Checked once per transfer: these INFO events fire on every call.
+        log_info = logger.isEnabledFor(logging.INFO)
+        if log_info:
+            logger.info(
+                "event=bank_transfer_request worker_role=sender transfer_id=%s idempotency_key=%s wallet_owner_ref=%s amount=%s",
+                transfer_id,
+                idempotency_key,
+                wallet_owner_ref,
+                amount,
+            )
         payload = {
             "idempotency_key": idempotency_key,
             "wallet_owner_ref": wallet_owner_ref,
             "amount": amount,
         }
-        headers = {
-            "X-Idempotency-Key": idempotency_key,
-        }
-        url = f"{self.base_url}/"
+        headers = {"X-Idempotency-Key": idempotency_key}
 
         for attempt in range(1, self.max_attempts + 1):
             self._acquire_rate_limit(
@@ -151,7 +203,7 @@ class BankGateway:
             )
             try:
                 response = self.http_client.post_json(
-                    url, json=payload, headers=headers
+                    self.transfer_url, json=payload, headers=headers
                 )
             except NetworkRequestFailed:
                 if attempt < self.max_attempts:
@@ -182,12 +234,13 @@ class BankGateway:
                 )
                 return TransferResult.unknown(error_reason="network_error")
 
-            logger.info(
-                "event=bank_transfer_http_response worker_role=sender transfer_id=%s idempotency_key=%s http_status=%s",
-                transfer_id,
-                idempotency_key,
-                response.status_code,
-            )
+            if log_info:
+                logger.info(
+                    "event=bank_transfer_http_response worker_role=sender transfer_id=%s idempotency_key=%s http_status=%s",
+                    transfer_id,
+                    idempotency_key,
+                    response.status_code,
+                )
 
             if response.status_code == 429:
                 retry_after_seconds = parse_retry_after_seconds(
@@ -225,12 +278,13 @@ class BankGateway:
                 fallback_reference=idempotency_key,
             )
             if result.success:
-                logger.info(
-                    "event=bank_transfer_success worker_role=sender transfer_id=%s idempotency_key=%s reference=%s",
-                    transfer_id,
-                    idempotency_key,
-                    result.reference,
-                )
+                if log_info:
+                    logger.info(
+                        "event=bank_transfer_success worker_role=sender transfer_id=%s idempotency_key=%s reference=%s",
+                        transfer_id,
+                        idempotency_key,
+                        result.reference,
+                    )
             elif result.is_final_failure:
                 logger.warning(
                     "event=bank_transfer_failed worker_role=sender transfer_id=%s idempotency_key=%s reason=%s",
@@ -259,7 +313,7 @@ class BankGateway:
         if not self.can_query_status():
             return TransferResult.unknown(error_reason="status_endpoint_not_configured")
 
-        url = self.status_url_template.format(
+        url = self._format_status_url(
             idempotency_key=idempotency_key,
             reference=reference or "",
         )
@@ -304,6 +358,15 @@ class BankGateway:
 
         return TransferResult.unknown(error_reason="status_query_retry_exhausted")
 
+    @staticmethod
+    def _success_reference(body, fallback_reference):
+        return (
+            body.get("reference")
+            or body.get("bank_reference")
+            or body.get("transfer_id")
+            or fallback_reference
+        )
+
     @staticmethod
     def _normalize_response(response, *, fallback_reference):
         try:
@@ -313,28 +376,33 @@ class BankGateway:
                 error_reason=f"invalid_json_response_http_{response.status_code}",
             )
 
-        response_status = body.get("status", response.status_code)
-        try:
-            normalized_status = int(response_status)
-        except (TypeError, ValueError):
-            normalized_status = response.status_code
+        status_code = response.status_code
+        body_status = body.get("status", status_code)
         body_state = body.get("data")
-        http_success = 200 <= response.status_code < 300
-
-        if http_success and normalized_status == 200 and body_state == "success":
-            reference = (
-                body.get("reference")
-                or body.get("bank_reference")
-                or body.get("transfer_id")
-                or fallback_reference
+        # JSON already yields an int status in the normal case; only strings
+        # and other odd values need int() coercion.
+        if type(body_status) is int:
+            normalized_status = body_status
+        else:
+            try:
+                normalized_status = int(body_status)
+            except (TypeError, ValueError):
+                normalized_status = status_code
+
+        if (
+            200 <= status_code < 300
+            and normalized_status == 200
+            and body_state == "success"
+        ):
+            return TransferResult.succeeded(
+                reference=BankGateway._success_reference(body, fallback_reference)
             )
-            return TransferResult.succeeded(reference=reference)
 
         failure_reason = (
             body.get("error_reason")
             or body_state
             or f"upstream_status_{normalized_status}"
         )
-        if response.status_code >= 500:
+        if status_code >= 500:
             return TransferResult.unknown(error_reason=str(failure_reason))
         return TransferResult.final_failure(error_reason=str(failure_reason))
@@ -1,24 +1,51 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+
 import requests
 from django.conf import settings
 
 from wallets.integrations.retry import retry_on_exceptions
 
+_RETRYABLE_ERRORS = (requests.Timeout, requests.ConnectionError)
+
 
 class NetworkRequestFailed(Exception):
     """Raised when network retries are exhausted."""
 
 
-def build_session():
+def build_session(adapter=None):
     session = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(
-        pool_connections=settings.BANK_HTTP_MAX_CONNECTIONS,
-        pool_maxsize=settings.BANK_HTTP_MAX_KEEPALIVE,
-    )
+    adapter = adapter or shared_adapter()
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
+@lru_cache(maxsize=None)
+def shared_adapter():
+    """Process-wide connection pool, so keep-alive connections outlive clients.
+
+    urllib3's pool is thread-safe and sized for the executor's concurrent
+    sends; ``requests.Session`` itself is not, so sessions are per thread.
+    """
+    return requests.adapters.HTTPAdapter(
+        pool_connections=settings.BANK_HTTP_MAX_CONNECTIONS,
+        pool_maxsize=max(settings.BANK_HTTP_MAX_KEEPALIVE, settings.BANK_CONCURRENCY),
+    )
+
+
+_thread_sessions = threading.local()
+
+
+def shared_session():
+    """This thread's session, mounted on the process-wide connection pool."""
+    session = getattr(_thread_sessions, "session", None)
+    if session is None:
+        session = _thread_sessions.session = build_session()
+    return session
+
+
 class HttpClient:
     def __init__(
         self,
@@ -30,31 +57,38 @@ class HttpClient:
         retry_base_delay=0.0,
         retry_max_delay=0.0,
     ):
-        self.session = session or build_session()
+        self._session = session
         self.connect_timeout = connect_timeout
         self.read_timeout = read_timeout
+        self._timeout = (connect_timeout, read_timeout)
         self.max_attempts = max_attempts
         self.retry_base_delay = retry_base_delay
         self.retry_max_delay = retry_max_delay
 
+    @property
+    def session(self):
+        # Resolved per call: bank transfers are sent from pool threads, and
+        # each thread must use its own session.
+        return self._session or shared_session()
+
     def post_json(self, url, *, json=None, headers=None):
         def send_once():
             return self.session.post(
                 url,
                 json=json,
                 headers=headers,
-                timeout=(self.connect_timeout, self.read_timeout),
+                timeout=self._timeout,
             )
 
         try:
             return retry_on_exceptions(
                 send_once,
-                exceptions=(requests.Timeout, requests.ConnectionError),
+                exceptions=_RETRYABLE_ERRORS,
                 max_attempts=self.max_attempts,
                 base_delay=self.retry_base_delay,
                 max_delay=self.retry_max_delay,
             )
-        except (requests.Timeout, requests.ConnectionError) as exc:
+        except _RETRYABLE_ERRORS as exc:
             raise NetworkRequestFailed("network request failed after retries") from exc
 
     def get_json(self, url, *, headers=None):
@@ -62,16 +96,35 @@ class HttpClient:
             return self.session.get(
                 url,
                 headers=headers,
-                timeout=(self.connect_timeout, self.read_timeout),
+                timeout=self._timeout,
             )
 
         try:
             return retry_on_exceptions(
                 send_once,
-                exceptions=(requests.Timeout, requests.ConnectionError),
+                exceptions=_RETRYABLE_ERRORS,
                 max_attempts=self.max_attempts,
                 base_delay=self.retry_base_delay,
                 max_delay=self.retry_max_delay,
             )
-        except (requests.Timeout, requests.ConnectionError) as exc:
+        except _RETRYABLE_ERRORS as exc:
             raise NetworkRequestFailed("network request failed after retries") from exc
+
+    def warmup(self, url, *, connections):
+        """Open up to ``connections`` pooled keep-alive connections to ``url``.
+
+        HEAD requests are sent in parallel so each one needs its own socket;
+        the response status is irrelevant. Returns how many requests completed.
+        """
+
+        def head_once(_):
+            try:
+                self.session.head(url, timeout=self._timeout).close()
+            except requests.RequestException:
+                return False
+            return True
+
+        if connections <= 0:
+            return 0
+        with ThreadPoolExecutor(max_workers=connections) as pool:
+            return sum(pool.map(head_once, range(connections)))
@@ -1,6 +1,8 @@
 import logging
+import threading
 import time
 from dataclasses import dataclass
+from functools import lru_cache
 
 from django.conf import settings
 
@@ -9,33 +11,30 @@ logger = logging.getLogger(__name__)
 
 _TOKEN_BUCKET_LUA = """
 local key = KEYS[1]
-local now_ms = tonumber(ARGV[1])
-local rate = tonumber(ARGV[2])
-local cost = tonumber(ARGV[3])
-local capacity = 1.0
+local rate = tonumber(ARGV[1])
+local cost = tonumber(ARGV[2])
+local capacity = tonumber(ARGV[3]) or 1.0
+-- Server clock, so executors on different hosts share one time base.
+local now = redis.call("TIME")
+local now_ms = tonumber(now[1]) * 1000 + math.floor(tonumber(now[2]) / 1000)
 
-local tokens = tonumber(redis.call("HGET", key, "tokens"))
-local ts_ms = tonumber(redis.call("HGET", key, "ts_ms"))
-
-if tokens == nil then
-  tokens = capacity
-end
-if ts_ms == nil then
-  ts_ms = now_ms
-end
+local state = redis.call("HMGET", key, "tokens", "ts_ms")
+local tokens = tonumber(state[1]) or capacity
+local ts_ms = tonumber(state[2]) or now_ms
 
 local elapsed = math.max(0, now_ms - ts_ms) / 1000.0
 tokens = math.min(capacity, tokens + elapsed * rate)
 
-if tokens >= cost then
-  tokens = tokens - cost
-  redis.call("HSET", key, "tokens", tokens, "ts_ms", now_ms)
-  return {1, 0}
-end
-
-local wait_seconds = (cost - tokens) / rate
+-- Always take the cost: a negative balance reserves the caller's slot, and
+-- the returned wait is how long until that slot's tokens are earned. Values
+-- are sent as strings because Redis truncates Lua numbers to integers.
+tokens = tokens - cost
 redis.call("HSET", key, "tokens", tokens, "ts_ms", now_ms)
-return {0, wait_seconds}
+local wait_seconds = 0
+if tokens < 0 then
+  wait_seconds = -tokens / rate
+end
+return {tostring(wait_seconds), tostring(tokens), tostring(capacity)}
 """
 
 
@@ -48,51 +47,133 @@ class BaseRateLimiter:
         raise NotImplementedError
 
 
-class NoopRateLimiter(BaseRateLimiter):
-    def acquire(self, *, cost=1):
-        return AcquireResult(wait_seconds=0.0, wait_events=0)
-
-
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AcquireResult:
     wait_seconds: float
     wait_events: int
+    tokens_remaining: float | None = None
+    capacity: float | None = None
+
+
+# Immutable, so one instance serves every acquire that did not wait.
+_NO_WAIT = AcquireResult(wait_seconds=0.0, wait_events=0)
+
+
+class NoopRateLimiter(BaseRateLimiter):
+    def acquire(self, *, cost=1):
+        return _NO_WAIT
 
 
 class RedisTokenBucketRateLimiter(BaseRateLimiter):
-    def __init__(self, *, redis_client, key, max_rps):
+    """Distributed token bucket with an optional process-local lease.
+
+    Each Redis call reserves tokens and returns how long to sleep before using
+    them, so an acquire is a single round trip however contended the bucket is.
+
+    With ``lease_size > 1`` each Redis round trip takes ``lease_size`` tokens
+    at once and later acquires in this process are served from the local
+    lease. Leased tokens expire after the time the bucket needs to earn them
+    back, so an idle lease cannot be spent as a burst later on.
+    """
+
+    def __init__(self, *, redis_client, key, max_rps, lease_size=1):
         if max_rps <= 0:
             raise ValueError("max_rps must be > 0")
+        if lease_size < 1:
+            raise ValueError("lease_size must be >= 1")
 
         self.redis_client = redis_client
         self.key = key
         self.max_rps = float(max_rps)
+        self.lease_size = int(lease_size)
+        self._lease_ttl = self.lease_size / self.max_rps
+        self._lease_lock = threading.Lock()
+        self._leased_tokens = 0.0
+        self._lease_expires_at = 0.0
         self._script = self.redis_client.register_script(_TOKEN_BUCKET_LUA)
 
     def acquire(self, *, cost=1):
-        wait_total = 0.0
-        wait_events = 0
-
-        while True:
-            now_ms = int(time.time() * 1000)
-            try:
-                allowed, wait_seconds = self._script(
+        cost = float(cost)
+        if self.lease_size > 1 and cost <= self.lease_size:
+            if self._take_leased(cost):
+                return _NO_WAIT
+            request_cost = float(self.lease_size)
+        else:
+            request_cost = cost
+        capacity = max(1.0, request_cost)
+
+        try:
+            wait_seconds, tokens_remaining, bucket_capacity = map(
+                float,
+                self._script(
                     keys=[self.key],
-                    args=[now_ms, self.max_rps, float(cost)],
-                )
-            except Exception as exc:
-                raise RateLimiterUnavailable("rate limiter unavailable") from exc
-
-            allowed = int(allowed)
-            wait_seconds = max(0.0, float(wait_seconds))
-
-            if allowed == 1:
-                return AcquireResult(wait_seconds=wait_total, wait_events=wait_events)
+                    args=[self.max_rps, request_cost, capacity],
+                ),
+            )
+        except Exception as exc:
+            raise RateLimiterUnavailable("rate limiter unavailable") from exc
+
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        if request_cost > cost:
+            self._store_lease(request_cost - cost)
+        return AcquireResult(
+            wait_seconds=wait_seconds,
+            wait_events=1 if wait_seconds > 0 else 0,
+            tokens_remaining=tokens_remaining,
+            capacity=bucket_capacity,
+        )
 
-            wait_events += 1
-            wait_total += wait_seconds
-            if wait_seconds > 0:
-                time.sleep(wait_seconds)
+    def _take_leased(self, cost):
+        with self._lease_lock:
+            if (
+                self._leased_tokens >= cost
+                and time.monotonic() < self._lease_expires_at
+            ):
+                self._leased_tokens -= cost
+                return True
+        return False
+
+    def _store_lease(self, tokens):
+        now = time.monotonic()
+        with self._lease_lock:
+            if now >= self._lease_expires_at:
+                self._leased_tokens = 0.0
+            self._leased_tokens += tokens
+            self._lease_expires_at = now + self._lease_ttl
+
+
+@lru_cache(maxsize=None)
+def _connect_redis_limiter(
+    redis_url,
+    key,
+    max_rps,
+    lease_size,
+    socket_connect_timeout,
+    socket_timeout,
+):
+    # Cached per configuration so every BankGateway in the process shares one
+    # client, its connection pool and its token lease. A failed connect raises
+    # and is therefore not cached; the next build tries again.
+    import redis
+
+    redis_client = redis.Redis.from_url(
+        redis_url,
+        socket_connect_timeout=socket_connect_timeout,
+        socket_timeout=socket_timeout,
+        decode_responses=False,
+        protocol=3,
+    )
+    redis_client.ping()
+    # register_script already calls EVALSHA; loading the script up front
+    # spares the first acquire a NOSCRIPT miss and full-body reload.
+    redis_client.script_load(_TOKEN_BUCKET_LUA)
+    return RedisTokenBucketRateLimiter(
+        redis_client=redis_client,
+        key=key,
+        max_rps=max_rps,
+        lease_size=lease_size,
+    )
 
 
 def build_rate_limiter():
@@ -102,7 +183,7 @@ def build_rate_limiter():
 
     redis_url = settings.BANK_RATE_LIMIT_REDIS_URL
     try:
-        import redis
+        import redis  # noqa: F401
     except Exception:
         logger.warning(
             "event=rate_limiter_disabled reason=redis_client_missing worker_role=sender"
@@ -110,22 +191,17 @@ def build_rate_limiter():
         return NoopRateLimiter()
 
     try:
-        redis_client = redis.Redis.from_url(
+        return _connect_redis_limiter(
             redis_url,
-            socket_connect_timeout=settings.BANK_REDIS_SOCKET_CONNECT_TIMEOUT,
-            socket_timeout=settings.BANK_REDIS_SOCKET_TIMEOUT,
-            decode_responses=True,
+            settings.BANK_RATE_LIMIT_KEY,
+            max_rps,
+            settings.BANK_RATE_LIMIT_LEASE_SIZE,
+            settings.BANK_REDIS_SOCKET_CONNECT_TIMEOUT,
+            settings.BANK_REDIS_SOCKET_TIMEOUT,
         )
-        redis_client.ping()
     except Exception:
         logger.warning(
             "event=rate_limiter_disabled reason=redis_unavailable redis_url=%s worker_role=sender",
             redis_url,
         )
         return NoopRateLimiter()
-
-    return RedisTokenBucketRateLimiter(
-        redis_client=redis_client,
-        key=settings.BANK_RATE_LIMIT_KEY,
-        max_rps=max_rps,
-    )
@@ -1,8 +1,21 @@
+import os
 import random
+import threading
 import time
-from datetime import datetime, timezone
+from datetime import timezone
 from email.utils import parsedate_to_datetime
 
+_thread_state = threading.local()
+
+
+def thread_rng():
+    # Each thread (concurrent senders, the executor's main loop) draws jitter
+    # from its own generator instead of sharing the module-level one.
+    rng = getattr(_thread_state, "rng", None)
+    if rng is None:
+        rng = _thread_state.rng = random.Random(os.urandom(8))
+    return rng
+
 
 def full_jitter_delay(attempt, *, base_delay, max_delay):
     if attempt < 1:
@@ -10,8 +23,9 @@ def full_jitter_delay(attempt, *, base_delay, max_delay):
     if base_delay < 0 or max_delay < 0:
         raise ValueError("base_delay and max_delay must be >= 0")
 
-    cap = min(max_delay, base_delay * (2 ** (attempt - 1)))
-    return random.uniform(0, cap)
+    # The exponent is clamped so very long retry runs cannot overflow a float.
+    cap = min(max_delay, base_delay * (2 ** min(attempt - 1, 63)))
+    return thread_rng().random() * cap
 
 
 def parse_retry_after_seconds(value):
@@ -35,9 +49,7 @@ def parse_retry_after_seconds(value):
 
     if retry_at.tzinfo is None:
         retry_at = retry_at.replace(tzinfo=timezone.utc)
-
-    now = datetime.now(timezone.utc)
-    return max(0.0, (retry_at - now).total_seconds())
+    return max(0.0, retry_at.timestamp() - time.time())
 
 
 def retry_on_exceptions(
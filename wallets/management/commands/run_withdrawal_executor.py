@@ -1,17 +1,30 @@
 import logging
-import random
 import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 
 from django.conf import settings
 from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connection
 from django.utils import timezone
 
+from wallets.integrations.bank_client import BankGateway
+from wallets.integrations.retry import thread_rng
 from wallets.tasks.execute_withdrawals import execute_due_withdrawals
 from wallets.tasks.reconcile_withdrawals import reconcile_withdrawals
 
 logger = logging.getLogger(__name__)
 
 
+def _run_with_own_connection(func, **kwargs):
+    # Each pool thread keeps its own DB connection across cycles; drop it once
+    # it is broken or past CONN_MAX_AGE, as Django does after a request.
+    try:
+        return func(**kwargs)
+    finally:
+        close_old_connections()
+
+
 class Command(BaseCommand):
     help = "Run due scheduled withdrawals once or in a loop."
 
@@ -62,34 +75,103 @@ class Command(BaseCommand):
             raise CommandError("--reconcile-limit must be greater than zero")
 
         if run_loop and startup_jitter_max > 0:
-            startup_wait = random.uniform(0, startup_jitter_max)
+            startup_wait = thread_rng().random() * startup_jitter_max
             logger.info(
                 "event=worker_startup_jitter worker_role=executor startup_delay_ms=%s",
                 int(startup_wait * 1000),
             )
             time.sleep(startup_wait)
 
-        while True:
-            now = timezone.now()
-            summary = execute_due_withdrawals(limit=limit, now=now)
-            reconcile_summary = reconcile_withdrawals(limit=reconcile_limit, now=now)
-            self.stdout.write(
-                self.style.SUCCESS(
-                    (
-                        "withdrawal executor run completed: "
-                        f"processed={summary['processed']} succeeded={summary['succeeded']} "
-                        f"failed={summary['failed']} insufficient_funds={summary['insufficient_funds']} "
-                        f"reconciliation_queued={summary.get('reconciliation_queued', 0)} "
-                        f"unknown={summary.get('unknown', 0)} "
-                        f"reconciled_success={reconcile_summary['resolved_success']} "
-                        f"reconciled_failure={reconcile_summary['resolved_failure']}"
+        if run_loop:
+            # Long-running workers open their bank connections up front so the
+            # first transfers do not pay the TCP/TLS handshake.
+            BankGateway().warmup()
+
+        # AIMD batch sizing: halve the batch when the bank pushes back (429s or
+        # unknown outcomes), then grow it back by one per clean run.
+        batch_limit = limit
+        # Execution waits on the bank while reconciliation mostly waits on the
+        # database, so with row-level SKIP LOCKED (PostgreSQL) the two passes
+        # run side by side. SQLite locks the whole database on write, so there
+        # they run one after the other.
+        run_concurrently = connection.features.has_select_for_update_skip_locked
+        pool_context = (
+            ThreadPoolExecutor(max_workers=2) if run_concurrently else nullcontext()
+        )
+        with pool_context as pool:
+            while True:
+                now = timezone.now()
+                summary, reconcile_summary = self._run_passes(
+                    pool,
+                    limit=batch_limit,
+                    reconcile_limit=reconcile_limit,
+                    now=now,
+                )
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        (
+                            "withdrawal executor run completed: "
+                            f"processed={summary['processed']} succeeded={summary['succeeded']} "
+                            f"failed={summary['failed']} insufficient_funds={summary['insufficient_funds']} "
+                            f"reconciliation_queued={summary.get('reconciliation_queued', 0)} "
+                            f"unknown={summary.get('unknown', 0)} "
+                            f"reconciled_success={reconcile_summary['resolved_success']} "
+                            f"reconciled_failure={reconcile_summary['resolved_failure']}"
+                        )
                     )
                 )
-            )
 
-            if not run_loop:
-                break
+                if not run_loop:
+                    break
+
+                processed_full_batch = summary["processed"] >= batch_limit
+                throttled = bool(
+                    summary.get("rate_limited", 0) or summary.get("unknown", 0)
+                )
+                if throttled:
+                    next_batch_limit = max(1, batch_limit // 2)
+                else:
+                    next_batch_limit = min(limit, batch_limit + 1)
+                if next_batch_limit != batch_limit:
+                    logger.info(
+                        "event=executor_batch_limit_changed worker_role=executor previous=%s current=%s rate_limited=%s unknown=%s",
+                        batch_limit,
+                        next_batch_limit,
+                        summary.get("rate_limited", 0),
+                        summary.get("unknown", 0),
+                    )
+                    batch_limit = next_batch_limit
+
+                if processed_full_batch and not throttled:
+                    # A full batch means more withdrawals are likely due; go again
+                    # straight away instead of letting the backlog wait a cycle.
+                    continue
+
+                jitter = (
+                    thread_rng().random() * loop_jitter_max
+                    if loop_jitter_max > 0
+                    else 0.0
+                )
+                sleep_seconds = max(0.0, base_interval + jitter)
+                time.sleep(sleep_seconds)
+
+    def _run_passes(self, pool, *, limit, reconcile_limit, now):
+        if pool is None:
+            return (
+                execute_due_withdrawals(limit=limit, now=now),
+                reconcile_withdrawals(limit=reconcile_limit, now=now),
+            )
 
-            jitter = random.uniform(0, loop_jitter_max) if loop_jitter_max > 0 else 0.0
-            sleep_seconds = max(0.0, base_interval + jitter)
-            time.sleep(sleep_seconds)
+        execute_future = pool.submit(
+            _run_with_own_connection,
+            execute_due_withdrawals,
+            limit=limit,
+            now=now,
+        )
+        reconcile_future = pool.submit(
+            _run_with_own_connection,
+            reconcile_withdrawals,
+            limit=reconcile_limit,
+            now=now,
+        )
+        return execute_future.result(), reconcile_future.result()
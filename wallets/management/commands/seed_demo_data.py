@@ -129,142 +129,127 @@ class Command(BaseCommand):
         return {"created": created, "updated": updated}
 
     def _seed_wallets_and_transactions(self, *, now):
-        wallets_created = 0
-        wallets_updated = 0
-        transactions_created = 0
-        transactions_updated = 0
         recon_created = 0
         recon_updated = 0
 
-        def upsert_wallet(wallet_uuid, balance):
-            nonlocal wallets_created, wallets_updated
-            wallet, created = Wallet.objects.update_or_create(
-                uuid=UUID(wallet_uuid),
-                defaults={"balance": balance},
-            )
-            if created:
-                wallets_created += 1
-            else:
-                wallets_updated += 1
-            return wallet
-
-        def upsert_transaction(idempotency_key, **defaults):
-            nonlocal transactions_created, transactions_updated
-            tx, created = Transaction.objects.update_or_create(
-                idempotency_key=idempotency_key,
-                defaults=defaults,
-            )
-            if created:
-                transactions_created += 1
-            else:
-                transactions_updated += 1
-            return tx
-
-        wallet_a = upsert_wallet("11111111-1111-1111-1111-111111111111", 120_000)
-        wallet_b = upsert_wallet("22222222-2222-2222-2222-222222222222", 45_000)
-        wallet_c = upsert_wallet("33333333-3333-3333-3333-333333333333", 3_000)
-
-        upsert_transaction(
-            "demo-deposit-a-001",
-            wallet=wallet_a,
-            type=Transaction.Type.DEPOSIT,
-            status=Transaction.Status.SUCCEEDED,
-            amount=150_000,
-            execute_at=None,
-            external_reference=None,
-            bank_reference=None,
-            failure_reason=None,
-        )
-        upsert_transaction(
-            "demo-withdrawal-a-001",
-            wallet=wallet_a,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.SUCCEEDED,
-            amount=30_000,
-            execute_at=now - timedelta(days=2),
-            external_reference="bank-demo-a-001",
-            bank_reference="bank-demo-a-001",
-            failure_reason=None,
-        )
-        upsert_transaction(
-            "demo-withdrawal-a-002",
-            wallet=wallet_a,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.SCHEDULED,
-            amount=20_000,
-            execute_at=now + timedelta(hours=1),
-            external_reference=None,
-            bank_reference=None,
-            failure_reason=None,
-        )
-
-        upsert_transaction(
-            "demo-deposit-b-001",
-            wallet=wallet_b,
-            type=Transaction.Type.DEPOSIT,
-            status=Transaction.Status.SUCCEEDED,
-            amount=50_000,
-            execute_at=None,
-            external_reference=None,
-            bank_reference=None,
-            failure_reason=None,
-        )
-        upsert_transaction(
-            "demo-withdrawal-b-001",
-            wallet=wallet_b,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.SUCCEEDED,
-            amount=5_000,
-            execute_at=now - timedelta(days=1, hours=1),
-            external_reference="bank-demo-b-001",
-            bank_reference="bank-demo-b-001",
-            failure_reason=None,
+        seed_wallets = [
+            Wallet(uuid=UUID("11111111-1111-1111-1111-111111111111"), balance=120_000),
+            Wallet(uuid=UUID("22222222-2222-2222-2222-222222222222"), balance=45_000),
+            Wallet(uuid=UUID("33333333-3333-3333-3333-333333333333"), balance=3_000),
+        ]
+        wallet_uuids = [wallet.uuid for wallet in seed_wallets]
+        existing_wallets = set(
+            Wallet.objects.filter(uuid__in=wallet_uuids).values_list("uuid", flat=True)
         )
-        upsert_transaction(
-            "demo-withdrawal-b-002",
-            wallet=wallet_b,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.FAILED,
-            amount=3_000,
-            execute_at=now - timedelta(days=1),
-            external_reference=None,
-            bank_reference=None,
-            failure_reason="bank_rejected",
+        Wallet.objects.bulk_create(
+            seed_wallets,
+            update_conflicts=True,
+            unique_fields=["uuid"],
+            update_fields=["balance", "updated_at"],
         )
+        wallets = Wallet.objects.in_bulk(wallet_uuids, field_name="uuid")
+        wallet_a, wallet_b, wallet_c = (wallets[uuid] for uuid in wallet_uuids)
 
-        upsert_transaction(
-            "demo-deposit-c-001",
-            wallet=wallet_c,
-            type=Transaction.Type.DEPOSIT,
-            status=Transaction.Status.SUCCEEDED,
-            amount=10_000,
-            execute_at=None,
-            external_reference=None,
-            bank_reference=None,
-            failure_reason=None,
-        )
-        unknown_tx = upsert_transaction(
-            "demo-withdrawal-c-001",
-            wallet=wallet_c,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.UNKNOWN,
-            amount=7_000,
-            execute_at=now - timedelta(hours=12),
-            external_reference=None,
-            bank_reference=None,
-            failure_reason="network_timeout",
+        seed_transactions = [
+            Transaction(
+                idempotency_key="demo-deposit-a-001",
+                wallet=wallet_a,
+                type=Transaction.Type.DEPOSIT,
+                status=Transaction.Status.SUCCEEDED,
+                amount=150_000,
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-a-001",
+                wallet=wallet_a,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.SUCCEEDED,
+                amount=30_000,
+                execute_at=now - timedelta(days=2),
+                external_reference="bank-demo-a-001",
+                bank_reference="bank-demo-a-001",
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-a-002",
+                wallet=wallet_a,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.SCHEDULED,
+                amount=20_000,
+                execute_at=now + timedelta(hours=1),
+            ),
+            Transaction(
+                idempotency_key="demo-deposit-b-001",
+                wallet=wallet_b,
+                type=Transaction.Type.DEPOSIT,
+                status=Transaction.Status.SUCCEEDED,
+                amount=50_000,
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-b-001",
+                wallet=wallet_b,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.SUCCEEDED,
+                amount=5_000,
+                execute_at=now - timedelta(days=1, hours=1),
+                external_reference="bank-demo-b-001",
+                bank_reference="bank-demo-b-001",
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-b-002",
+                wallet=wallet_b,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.FAILED,
+                amount=3_000,
+                execute_at=now - timedelta(days=1),
+                failure_reason="bank_rejected",
+            ),
+            Transaction(
+                idempotency_key="demo-deposit-c-001",
+                wallet=wallet_c,
+                type=Transaction.Type.DEPOSIT,
+                status=Transaction.Status.SUCCEEDED,
+                amount=10_000,
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-c-001",
+                wallet=wallet_c,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.UNKNOWN,
+                amount=7_000,
+                execute_at=now - timedelta(hours=12),
+                failure_reason="network_timeout",
+            ),
+            Transaction(
+                idempotency_key="demo-withdrawal-c-002",
+                wallet=wallet_c,
+                type=Transaction.Type.WITHDRAWAL,
+                status=Transaction.Status.SCHEDULED,
+                amount=2_500,
+                execute_at=now + timedelta(minutes=30),
+            ),
+        ]
+        transaction_keys = [tx.idempotency_key for tx in seed_transactions]
+        existing_transactions = set(
+            Transaction.objects.filter(
+                idempotency_key__in=transaction_keys
+            ).values_list("idempotency_key", flat=True)
         )
-        upsert_transaction(
-            "demo-withdrawal-c-002",
-            wallet=wallet_c,
-            type=Transaction.Type.WITHDRAWAL,
-            status=Transaction.Status.SCHEDULED,
-            amount=2_500,
-            execute_at=now + timedelta(minutes=30),
-            external_reference=None,
-            bank_reference=None,
-            failure_reason=None,
+        Transaction.objects.bulk_create(
+            seed_transactions,
+            update_conflicts=True,
+            unique_fields=["idempotency_key"],
+            update_fields=[
+                "wallet",
+                "type",
+                "status",
+                "amount",
+                "execute_at",
+                "external_reference",
+                "bank_reference",
+                "failure_reason",
+                "updated_at",
+            ],
         )
+        unknown_tx = Transaction.objects.get(idempotency_key="demo-withdrawal-c-001")
 
         task, created = WithdrawalReconciliationTask.objects.update_or_create(
             transaction=unknown_tx,
@@ -279,10 +264,10 @@ class Command(BaseCommand):
             recon_updated += 1
 
         return {
-            "wallets_created": wallets_created,
-            "wallets_updated": wallets_updated,
-            "transactions_created": transactions_created,
-            "transactions_updated": transactions_updated,
+            "wallets_created": len(seed_wallets) - len(existing_wallets),
+            "wallets_updated": len(existing_wallets),
+            "transactions_created": len(seed_transactions) - len(existing_transactions),
+            "transactions_updated": len(existing_transactions),
             "recon_created": recon_created,
             "recon_updated": recon_updated,
             "wallet_ids": [str(wallet_a.id), str(wallet_b.id), str(wallet_c.id)],
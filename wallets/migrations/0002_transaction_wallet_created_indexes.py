@@ -0,0 +1,30 @@
+# Generated by Django 5.2.1 on 2026-10-15 07:45
+
+from django.db import migrations, models
+
+from wallets.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("wallets", "0001_initial"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["wallet", "-created_at"], name="txn_wallet_created_idx"
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                fields=["wallet", "type", "status", "-created_at"],
+                name="txn_wallet_type_status_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.1 on 2026-10-15 08:06
+
+from django.db import migrations, models
+
+from wallets.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("wallets", "0002_transaction_wallet_created_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("status", "SCHEDULED"), ("type", "WITHDRAWAL")),
+                fields=["execute_at", "id"],
+                name="txn_due_scheduled_idx",
+            ),
+        ),
+        AddIndexConcurrently(
+            model_name="withdrawalreconciliationtask",
+            index=models.Index(
+                condition=models.Q(("status", "PENDING")),
+                fields=["created_at", "id"],
+                name="recon_pending_created_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.1 on 2026-10-15 08:16
+
+from django.db import migrations, models
+
+from wallets.migrations._operations import AddIndexConcurrently
+
+
+class Migration(migrations.Migration):
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+    atomic = False
+
+    dependencies = [
+        ("wallets", "0003_partial_due_indexes"),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name="transaction",
+            index=models.Index(
+                condition=models.Q(("status", "PROCESSING"), ("type", "WITHDRAWAL")),
+                fields=["updated_at", "id"],
+                name="txn_stale_processing_idx",
+            ),
+        ),
+    ]
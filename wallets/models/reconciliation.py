@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 
 
 class WithdrawalReconciliationTask(models.Model):
@@ -24,7 +25,12 @@ class WithdrawalReconciliationTask(models.Model):
         indexes = [
             models.Index(
                 fields=["status", "created_at"], name="recon_status_created_idx"
-            )
+            ),
+            models.Index(
+                fields=["created_at", "id"],
+                name="recon_pending_created_idx",
+                condition=Q(status="PENDING"),
+            ),
         ]
 
     def __str__(self):
@@ -38,6 +38,24 @@ class Transaction(models.Model):
                 fields=["type", "status", "execute_at"],
                 name="txn_type_status_execute_idx",
             ),
+            models.Index(
+                fields=["execute_at", "id"],
+                name="txn_due_scheduled_idx",
+                condition=Q(type="WITHDRAWAL", status="SCHEDULED"),
+            ),
+            models.Index(
+                fields=["updated_at", "id"],
+                name="txn_stale_processing_idx",
+                condition=Q(type="WITHDRAWAL", status="PROCESSING"),
+            ),
+            models.Index(
+                fields=["wallet", "-created_at"],
+                name="txn_wallet_created_idx",
+            ),
+            models.Index(
+                fields=["wallet", "type", "status", "-created_at"],
+                name="txn_wallet_type_status_idx",
+            ),
         ]
         constraints = [
             models.CheckConstraint(
@@ -1,11 +1,21 @@
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import timedelta
+from functools import lru_cache, partial
 
 from django.conf import settings
-from django.db import OperationalError, connection, transaction
-from django.db.models import F
+from django.db import OperationalError, connection, connections, transaction
+from django.db.models import (
+    BigIntegerField,
+    Case,
+    F,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
 from django.utils import timezone
 
 from wallets.integrations.bank_client import (
@@ -13,7 +23,7 @@ from wallets.integrations.bank_client import (
     TransferOutcome,
     TransferResult,
 )
-from wallets.integrations.idempotency import ensure_transaction_idempotency_key
+from wallets.integrations.retry import full_jitter_delay
 from wallets.models import Transaction, Wallet, WithdrawalReconciliationTask
 
 logger = logging.getLogger(__name__)
@@ -27,17 +37,54 @@ class ClaimedWithdrawal:
     idempotency_key: str
 
 
+@lru_cache(maxsize=None)
+def _execution_lock_options(alias):
+    # Backend features do not change at runtime, so work them out once per
+    # database alias. None means the backend has no row locks.
+    features = connections[alias].features
+    if not features.has_select_for_update:
+        return None
+
+    lock_options = {}
+    if features.has_select_for_update_skip_locked:
+        lock_options["skip_locked"] = True
+    # Lock only the transaction rows, not joined wallets, and use NO KEY so
+    # concurrent FK checks against these rows are not blocked.
+    if features.has_select_for_update_of:
+        lock_options["of"] = ("self",)
+    if features.has_select_for_no_key_update:
+        lock_options["no_key"] = True
+    return lock_options
+
+
 def _with_execution_lock(queryset):
-    if connection.features.has_select_for_update:
-        if connection.features.has_select_for_update_skip_locked:
-            return queryset.select_for_update(skip_locked=True)
-        return queryset.select_for_update()
-    return queryset
+    lock_options = _execution_lock_options(queryset.db)
+    if lock_options is None:
+        return queryset
+    return queryset.select_for_update(**lock_options)
+
+
+def _with_wallet_uuid(queryset):
+    # The wallet's uuid is the only wallet column a claim needs, so read it with
+    # a subquery rather than joining and fetching the whole wallet row.
+    return queryset.annotate(
+        wallet_uuid=Subquery(
+            Wallet.objects.filter(pk=OuterRef("wallet_id")).values("uuid")[:1]
+        )
+    ).only("id", "wallet_id", "amount", "idempotency_key")
+
 
+def _recycle_connection():
+    # Looping workers keep their connection between passes (DB_CONN_MAX_AGE);
+    # replace it once it is broken or past its max age, as Django does around
+    # each request. Never inside a transaction the caller is still using.
+    if not connection.in_atomic_block:
+        connection.close_if_unusable_or_obsolete()
 
-def _queue_reconciliation_task(transaction, *, reason):
+
+def _queue_reconciliation_task(transaction_id, *, reason):
     task, created = WithdrawalReconciliationTask.objects.get_or_create(
-        transaction=transaction,
+        transaction_id=transaction_id,
         defaults={"reason": reason},
     )
     return task, created
@@ -48,7 +95,7 @@ def _mark_unknown_and_queue_reconciliation(transaction, *, reason):
     transaction.failure_reason = reason
     transaction.save(update_fields=["status", "failure_reason", "updated_at"])
     task, created = _queue_reconciliation_task(
-        transaction,
+        transaction.id,
         reason="UNKNOWN_TRANSFER_OUTCOME",
     )
     logger.warning(
@@ -62,7 +109,30 @@ def _mark_unknown_and_queue_reconciliation(transaction, *, reason):
     return task, created
 
 
-def _claim_next_due_withdrawal(now):
+def _debit_wallets(amounts):
+    """Debit ``{wallet_id: amount}`` in one UPDATE, skipping underfunded wallets.
+
+    Returns the ids of the wallets that were debited.
+    """
+    quote_name = connection.ops.quote_name
+    wallet_id = quote_name("id")
+    balance = quote_name("balance")
+    case_sql = " ".join(["WHEN %s THEN %s"] * len(amounts))
+    case_params = [value for item in amounts.items() for value in item]
+    placeholders = ", ".join(["%s"] * len(amounts))
+    sql = (
+        f"UPDATE {quote_name(Wallet._meta.db_table)} "
+        f"SET {balance} = {balance} - CASE {wallet_id} {case_sql} END "
+        f"WHERE {wallet_id} IN ({placeholders}) "
+        f"AND {balance} >= CASE {wallet_id} {case_sql} END "
+        f"RETURNING {wallet_id}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*case_params, *amounts, *case_params])
+        return {row[0] for row in cursor.fetchall()}
+
+
+def _claim_due_withdrawals(now, limit):
     queryset = Transaction.objects.filter(
         type=Transaction.Type.WITHDRAWAL,
         status=Transaction.Status.SCHEDULED,
@@ -70,50 +140,89 @@ def _claim_next_due_withdrawal(now):
     ).order_by("execute_at", "id")
 
     with transaction.atomic():
-        tx = _with_execution_lock(queryset).select_related("wallet").first()
-        if tx is None:
-            return None
-
-        wallet = Wallet.objects.select_for_update().get(pk=tx.wallet_id)
-        debited = Wallet.objects.filter(pk=wallet.pk, balance__gte=tx.amount).update(
-            balance=F("balance") - tx.amount
-        )
-        if debited == 0:
-            tx.status = Transaction.Status.FAILED
-            tx.failure_reason = "INSUFFICIENT_FUNDS"
-            tx.save(update_fields=["status", "failure_reason", "updated_at"])
-            logger.info(
-                "event=withdrawal_failed_insufficient_funds worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s amount=%s",
-                tx.id,
-                tx.idempotency_key,
-                tx.wallet_id,
-                tx.amount,
+        txs = list(_with_wallet_uuid(_with_execution_lock(queryset))[:limit])
+        if not txs:
+            return []
+
+        # Debit in rounds: round N takes each wallet's N-th due withdrawal, so a
+        # wallet with several due rows is charged in execute_at order exactly as
+        # a row-by-row loop would, while each round is a single UPDATE.
+        rounds = []
+        for tx in txs:
+            for round_txs in rounds:
+                if tx.wallet_id not in round_txs:
+                    round_txs[tx.wallet_id] = tx
+                    break
+            else:
+                rounds.append({tx.wallet_id: tx})
+
+        debited_ids = set()
+        for round_txs in rounds:
+            debited_wallets = _debit_wallets(
+                {wallet_id: tx.amount for wallet_id, tx in round_txs.items()}
+            )
+            debited_ids.update(
+                tx.id
+                for wallet_id, tx in round_txs.items()
+                if wallet_id in debited_wallets
             )
-            return {"outcome": "insufficient_funds", "transaction_id": tx.id}
 
-        tx.idempotency_key = ensure_transaction_idempotency_key(tx)
-        tx.status = Transaction.Status.PROCESSING
-        tx.failure_reason = None
-        tx.save(
-            update_fields=["idempotency_key", "status", "failure_reason", "updated_at"]
-        )
-        logger.info(
-            "event=withdrawal_claimed worker_role=executor tx_id=%s wallet_id=%s amount=%s idempotency_key=%s claim_type=scheduled",
-            tx.id,
-            tx.wallet_id,
-            tx.amount,
-            tx.idempotency_key,
-        )
+        insufficient = [tx for tx in txs if tx.id not in debited_ids]
+        claimed = [tx for tx in txs if tx.id in debited_ids]
+        if insufficient:
+            Transaction.objects.filter(pk__in=[tx.id for tx in insufficient]).update(
+                status=Transaction.Status.FAILED,
+                failure_reason="INSUFFICIENT_FUNDS",
+                updated_at=timezone.now(),
+            )
+        if claimed:
+            # Withdrawals always carry an idempotency key (the
+            # transaction_idempotency_by_type constraint), so claiming only
+            # flips the status.
+            Transaction.objects.filter(pk__in=[tx.id for tx in claimed]).update(
+                status=Transaction.Status.PROCESSING,
+                failure_reason=None,
+                updated_at=timezone.now(),
+            )
 
-        return {
-            "outcome": "claimed",
-            "claim": ClaimedWithdrawal(
-                transaction_id=tx.id,
-                wallet_owner_ref=str(wallet.uuid),
-                amount=tx.amount,
-                idempotency_key=tx.idempotency_key,
-            ),
-        }
+        # Checked once per batch: these INFO events fire for every claimed row.
+        log_info = logger.isEnabledFor(logging.INFO)
+        results = []
+        for tx in txs:
+            if tx.id not in debited_ids:
+                if log_info:
+                    logger.info(
+                        "event=withdrawal_failed_insufficient_funds worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s amount=%s",
+                        tx.id,
+                        tx.idempotency_key,
+                        tx.wallet_id,
+                        tx.amount,
+                    )
+                results.append(
+                    {"outcome": "insufficient_funds", "transaction_id": tx.id}
+                )
+                continue
+
+            if log_info:
+                logger.info(
+                    "event=withdrawal_claimed worker_role=executor tx_id=%s wallet_id=%s amount=%s idempotency_key=%s claim_type=scheduled",
+                    tx.id,
+                    tx.wallet_id,
+                    tx.amount,
+                    tx.idempotency_key,
+                )
+            results.append(
+                {
+                    "outcome": "claimed",
+                    "claim": ClaimedWithdrawal(
+                        transaction_id=tx.id,
+                        wallet_owner_ref=str(tx.wallet_uuid),
+                        amount=tx.amount,
+                        idempotency_key=tx.idempotency_key,
+                    ),
+                }
+            )
+        return results
 
 
 def _claim_stale_processing_withdrawal(now, *, stale_after_seconds):
@@ -125,13 +234,14 @@ def _claim_stale_processing_withdrawal(now, *, stale_after_seconds):
     ).order_by("updated_at", "id")
 
     with transaction.atomic():
-        tx = _with_execution_lock(queryset).select_related("wallet").first()
+        tx = _with_wallet_uuid(_with_execution_lock(queryset)).first()
         if tx is None:
             return None
 
-        tx.idempotency_key = ensure_transaction_idempotency_key(tx)
-        tx.failure_reason = None
-        tx.save(update_fields=["idempotency_key", "failure_reason", "updated_at"])
+        Transaction.objects.filter(pk=tx.id).update(
+            failure_reason=None,
+            updated_at=timezone.now(),
+        )
 
         logger.warning(
             "event=withdrawal_reclaimed_processing worker_role=executor tx_id=%s wallet_id=%s idempotency_key=%s",
@@ -143,7 +253,7 @@ def _claim_stale_processing_withdrawal(now, *, stale_after_seconds):
             "outcome": "claimed",
             "claim": ClaimedWithdrawal(
                 transaction_id=tx.id,
-                wallet_owner_ref=str(tx.wallet.uuid),
+                wallet_owner_ref=str(tx.wallet_uuid),
                 amount=tx.amount,
                 idempotency_key=tx.idempotency_key,
             ),
@@ -182,66 +292,190 @@ def _queue_stale_processing_for_reconciliation(now, *, stale_after_seconds):
         return {"outcome": "reconciliation_queued", "transaction_id": tx.id}
 
 
-def _finalize_claimed_withdrawal(claim, transfer_result):
-    with transaction.atomic():
-        tx = Transaction.objects.select_for_update().get(pk=claim.transaction_id)
-        wallet = Wallet.objects.select_for_update().get(pk=tx.wallet_id)
-
-        if tx.status != Transaction.Status.PROCESSING:
-            logger.info(
-                "event=withdrawal_finalize_skipped worker_role=executor tx_id=%s idempotency_key=%s current_status=%s",
-                tx.id,
-                tx.idempotency_key,
-                tx.status,
-            )
-            return "skipped"
+def _settle_processing_withdrawals(values, *, status, now):
+    """Move the PROCESSING rows among ``values`` to ``status`` in one UPDATE.
+
+    ``values`` maps transaction ids to ``{field: value}`` dicts with the same
+    fields. The ``status`` guard replaces locking and re-reading the rows;
+    returns ``{tx_id: (wallet_id, amount)}`` for the rows that were updated.
+    """
+    if not values:
+        return {}
+
+    quote_name = connection.ops.quote_name
+    tx_id = quote_name("id")
+    status_column = quote_name("status")
+    fields = next(iter(values.values())).keys()
+    case_sql = " ".join(["WHEN %s THEN %s"] * len(values))
+    assignments = [f"{status_column} = %s", f"{quote_name('updated_at')} = %s"]
+    params = [
+        status,
+        Transaction._meta.get_field("updated_at").get_db_prep_value(now, connection),
+    ]
+    for field in fields:
+        column = quote_name(Transaction._meta.get_field(field).column)
+        assignments.append(f"{column} = CASE {tx_id} {case_sql} END")
+        params.extend(value for pk, row in values.items() for value in (pk, row[field]))
+    placeholders = ", ".join(["%s"] * len(values))
+    sql = (
+        f"UPDATE {quote_name(Transaction._meta.db_table)} "
+        f"SET {', '.join(assignments)} "
+        f"WHERE {tx_id} IN ({placeholders}) AND {status_column} = %s "
+        f"RETURNING {tx_id}, {quote_name('wallet_id')}, {quote_name('amount')}"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, *values, Transaction.Status.PROCESSING])
+        return {row[0]: (row[1], row[2]) for row in cursor.fetchall()}
+
+
+def _finalize_claimed_withdrawals(claims, transfer_results):
+    """Settle a batch of sent transfers; returns one result per claim, in order.
 
+    Each outcome is written with one guarded UPDATE and all refunds with a
+    single wallet UPDATE; claims no longer PROCESSING are skipped.
+    """
+    succeeded_values = {}
+    failed_values = {}
+    unknown_values = {}
+    for claim, transfer_result in zip(claims, transfer_results, strict=True):
         if transfer_result.outcome == TransferOutcome.SUCCESS:
-            tx.status = Transaction.Status.SUCCEEDED
-            tx.external_reference = transfer_result.reference
-            tx.bank_reference = transfer_result.reference
-            tx.failure_reason = None
-            tx.save(
-                update_fields=[
-                    "status",
-                    "external_reference",
-                    "bank_reference",
-                    "failure_reason",
-                    "updated_at",
-                ]
-            )
-            logger.info(
-                "event=withdrawal_succeeded worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s reference=%s",
-                tx.id,
-                tx.idempotency_key,
-                tx.wallet_id,
-                transfer_result.reference,
-            )
-            return "succeeded"
+            succeeded_values[claim.transaction_id] = {
+                "external_reference": transfer_result.reference,
+                "bank_reference": transfer_result.reference,
+                "failure_reason": None,
+            }
+        elif transfer_result.outcome == TransferOutcome.UNKNOWN:
+            unknown_values[claim.transaction_id] = {
+                "failure_reason": transfer_result.error_reason
+                or "UNKNOWN_TRANSFER_OUTCOME",
+            }
+        else:
+            failed_values[claim.transaction_id] = {
+                "failure_reason": transfer_result.error_reason
+                or "BANK_TRANSFER_FAILED",
+            }
+
+    with transaction.atomic():
+        now = timezone.now()
+        succeeded = _settle_processing_withdrawals(
+            succeeded_values, status=Transaction.Status.SUCCEEDED, now=now
+        )
+        failed = _settle_processing_withdrawals(
+            failed_values, status=Transaction.Status.FAILED, now=now
+        )
+        unknown = _settle_processing_withdrawals(
+            unknown_values, status=Transaction.Status.UNKNOWN, now=now
+        )
 
-        if transfer_result.outcome == TransferOutcome.UNKNOWN:
-            _mark_unknown_and_queue_reconciliation(
-                tx,
-                reason=transfer_result.error_reason or "UNKNOWN_TRANSFER_OUTCOME",
+        log_info = logger.isEnabledFor(logging.INFO)
+        results = []
+        refunds = {}
+        for claim in claims:
+            tx_id = claim.transaction_id
+            if tx_id in succeeded:
+                if log_info:
+                    logger.info(
+                        "event=withdrawal_succeeded worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s reference=%s",
+                        tx_id,
+                        claim.idempotency_key,
+                        succeeded[tx_id][0],
+                        succeeded_values[tx_id]["bank_reference"],
+                    )
+                results.append("succeeded")
+            elif tx_id in unknown:
+                reason = unknown_values[tx_id]["failure_reason"]
+                task, created = _queue_reconciliation_task(
+                    tx_id,
+                    reason="UNKNOWN_TRANSFER_OUTCOME",
+                )
+                logger.warning(
+                    "event=withdrawal_marked_unknown worker_role=executor tx_id=%s idempotency_key=%s reason=%s reconciliation_task_id=%s reconciliation_created=%s",
+                    tx_id,
+                    claim.idempotency_key,
+                    reason,
+                    task.id,
+                    created,
+                )
+                results.append("unknown")
+            elif tx_id in failed:
+                wallet_id, amount = failed[tx_id]
+                refunds[wallet_id] = refunds.get(wallet_id, 0) + amount
+                logger.warning(
+                    "event=withdrawal_failed_refunded worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s reason=%s amount=%s",
+                    tx_id,
+                    claim.idempotency_key,
+                    wallet_id,
+                    failed_values[tx_id]["failure_reason"],
+                    amount,
+                )
+                results.append("failed")
+            else:
+                if log_info:
+                    logger.info(
+                        "event=withdrawal_finalize_skipped worker_role=executor tx_id=%s idempotency_key=%s reason=not_processing",
+                        tx_id,
+                        claim.idempotency_key,
+                    )
+                results.append("skipped")
+
+        if refunds:
+            Wallet.objects.filter(pk__in=refunds).update(
+                balance=F("balance")
+                + Case(
+                    *(
+                        When(pk=wallet_id, then=Value(amount))
+                        for wallet_id, amount in refunds.items()
+                    ),
+                    output_field=BigIntegerField(),
+                )
             )
-            return "unknown"
+        return results
 
-        Wallet.objects.filter(pk=wallet.pk).update(balance=F("balance") + tx.amount)
-        tx.status = Transaction.Status.FAILED
-        tx.failure_reason = transfer_result.error_reason or "BANK_TRANSFER_FAILED"
-        tx.save(update_fields=["status", "failure_reason", "updated_at"])
-        logger.warning(
-            "event=withdrawal_failed_refunded worker_role=executor tx_id=%s idempotency_key=%s wallet_id=%s reason=%s amount=%s",
-            tx.id,
-            tx.idempotency_key,
-            tx.wallet_id,
-            tx.failure_reason,
-            tx.amount,
+
+def _send_transfer(bank_gateway, claim):
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "event=withdrawal_execution_start worker_role=executor tx_id=%s idempotency_key=%s wallet_owner_ref=%s amount=%s",
+            claim.transaction_id,
+            claim.idempotency_key,
+            claim.wallet_owner_ref,
+            claim.amount,
+        )
+
+    try:
+        return bank_gateway.transfer(
+            idempotency_key=claim.idempotency_key,
+            wallet_owner_ref=claim.wallet_owner_ref,
+            amount=claim.amount,
+            transfer_id=claim.transaction_id,
+        )
+    except Exception as exc:
+        logger.exception(
+            "event=executor_gateway_exception worker_role=executor tx_id=%s idempotency_key=%s error=%s",
+            claim.transaction_id,
+            claim.idempotency_key,
+            exc.__class__.__name__,
+        )
+        return TransferResult.unknown(
+            error_reason=f"gateway_exception:{exc.__class__.__name__}",
         )
-        return "failed"
+
+
+def _send_transfers(bank_gateway, claims, concurrency):
+    """Send the batch's transfers, up to ``concurrency`` at a time.
+
+    Bank calls are network-bound and touch no database state, so they can
+    overlap; results are returned in claim order.
+    """
+    if concurrency <= 1 or len(claims) <= 1:
+        return [_send_transfer(bank_gateway, claim) for claim in claims]
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(claims))) as pool:
+        return list(pool.map(partial(_send_transfer, bank_gateway), claims))
 
 
 def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
+    _recycle_connection()
     now = now or timezone.now()
 
     if limit <= 0:
@@ -252,13 +486,18 @@ def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
             "insufficient_funds": 0,
             "reconciliation_queued": 0,
             "unknown": 0,
+            "rate_limited": 0,
         }
 
     bank_gateway = gateway or BankGateway()
     stale_after_seconds = settings.WITHDRAWAL_PROCESSING_STALE_SECONDS
     max_lock_contention_retries = settings.EXECUTOR_LOCK_CONTENTION_MAX_RETRIES
     lock_contention_backoff_seconds = settings.EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS
+    lock_contention_backoff_cap_seconds = (
+        settings.EXECUTOR_LOCK_CONTENTION_BACKOFF_CAP_SECONDS
+    )
     bank_honors_idempotency = settings.BANK_HONORS_IDEMPOTENCY
+    bank_concurrency = settings.BANK_CONCURRENCY
     logger.info(
         "event=executor_start limit=%s now=%s stale_after_seconds=%s max_lock_contention_retries=%s lock_contention_backoff_seconds=%s bank_honors_idempotency=%s",
         limit,
@@ -275,12 +514,18 @@ def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
     insufficient_funds = 0
     reconciliation_queued = 0
     unknown = 0
+    rate_limited = 0
     lock_contention_retries = 0
 
     while processed < limit:
         try:
-            claim_result = _claim_next_due_withdrawal(now)
-            if claim_result is None:
+            # Claim no more rows than can be sent in one concurrent round, so a
+            # claimed row never waits behind other sends long enough to look
+            # stale to another executor.
+            claim_results = _claim_due_withdrawals(
+                now, min(limit - processed, bank_concurrency)
+            )
+            if not claim_results:
                 if bank_honors_idempotency:
                     claim_result = _claim_stale_processing_withdrawal(
                         now,
@@ -291,6 +536,8 @@ def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
                         now,
                         stale_after_seconds=stale_after_seconds,
                     )
+                if claim_result is not None:
+                    claim_results = [claim_result]
         except OperationalError:
             lock_contention_retries += 1
             logger.warning(
@@ -306,63 +553,52 @@ def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
                     lock_contention_retries,
                 )
                 break
-            if lock_contention_backoff_seconds > 0:
-                time.sleep(lock_contention_backoff_seconds)
+            # Jittered exponential backoff keeps contending workers from
+            # retrying in lockstep.
+            delay = full_jitter_delay(
+                lock_contention_retries,
+                base_delay=lock_contention_backoff_seconds,
+                max_delay=lock_contention_backoff_cap_seconds,
+            )
+            if delay > 0:
+                time.sleep(delay)
             continue
 
-        if claim_result is None:
+        if not claim_results:
             break
         lock_contention_retries = 0
 
-        outcome = claim_result["outcome"]
-        if outcome == "insufficient_funds":
-            processed += 1
-            failed += 1
-            insufficient_funds += 1
-            continue
-        if outcome == "reconciliation_queued":
-            processed += 1
-            reconciliation_queued += 1
+        claims = []
+        for claim_result in claim_results:
+            outcome = claim_result["outcome"]
+            if outcome == "insufficient_funds":
+                processed += 1
+                failed += 1
+                insufficient_funds += 1
+                continue
+            if outcome == "reconciliation_queued":
+                processed += 1
+                reconciliation_queued += 1
+                continue
+            claims.append(claim_result["claim"])
+
+        if not claims:
             continue
-
-        claim = claim_result["claim"]
-        logger.info(
-            "event=withdrawal_execution_start worker_role=executor tx_id=%s idempotency_key=%s wallet_owner_ref=%s amount=%s",
-            claim.transaction_id,
-            claim.idempotency_key,
-            claim.wallet_owner_ref,
-            claim.amount,
+        transfer_results = _send_transfers(bank_gateway, claims, bank_concurrency)
+        rate_limited += sum(
+            result.error_reason == "rate_limited" for result in transfer_results
         )
-
-        try:
-            transfer_result = bank_gateway.transfer(
-                idempotency_key=claim.idempotency_key,
-                wallet_owner_ref=claim.wallet_owner_ref,
-                amount=claim.amount,
-                transfer_id=claim.transaction_id,
-            )
-        except Exception as exc:
-            transfer_result = TransferResult.unknown(
-                error_reason=f"gateway_exception:{exc.__class__.__name__}",
-            )
-            logger.exception(
-                "event=executor_gateway_exception worker_role=executor tx_id=%s idempotency_key=%s error=%s",
-                claim.transaction_id,
-                claim.idempotency_key,
-                exc.__class__.__name__,
-            )
-
-        finalize_result = _finalize_claimed_withdrawal(claim, transfer_result)
-        if finalize_result == "succeeded":
-            succeeded += 1
-            processed += 1
-        elif finalize_result == "failed":
-            failed += 1
-            processed += 1
-        elif finalize_result == "unknown":
-            unknown += 1
-            reconciliation_queued += 1
-            processed += 1
+        for finalize_result in _finalize_claimed_withdrawals(claims, transfer_results):
+            if finalize_result == "succeeded":
+                succeeded += 1
+                processed += 1
+            elif finalize_result == "failed":
+                failed += 1
+                processed += 1
+            elif finalize_result == "unknown":
+                unknown += 1
+                reconciliation_queued += 1
+                processed += 1
 
     summary = {
         "processed": processed,
@@ -371,14 +607,16 @@ def execute_due_withdrawals(limit=100, now=None, *, gateway=None):
         "insufficient_funds": insufficient_funds,
         "reconciliation_queued": reconciliation_queued,
         "unknown": unknown,
+        "rate_limited": rate_limited,
     }
     logger.info(
-        "event=executor_end worker_role=executor processed=%s succeeded=%s failed=%s insufficient_funds=%s reconciliation_queued=%s unknown=%s",
+        "event=executor_end worker_role=executor processed=%s succeeded=%s failed=%s insufficient_funds=%s reconciliation_queued=%s unknown=%s rate_limited=%s",
         summary["processed"],
         summary["succeeded"],
         summary["failed"],
         summary["insufficient_funds"],
         summary["reconciliation_queued"],
         summary["unknown"],
+        summary["rate_limited"],
     )
     return summary
@@ -10,6 +10,7 @@ from wallets.integrations.bank_client import BankGateway, TransferOutcome
 from wallets.models import Transaction, Wallet, WithdrawalReconciliationTask
 from wallets.tasks.execute_withdrawals import (
     _mark_unknown_and_queue_reconciliation,
+    _recycle_connection,
     _with_execution_lock,
 )
 
@@ -134,6 +135,7 @@ def _mark_stale_processing_unknown(now, *, timeout_seconds, limit):
 
 
 def reconcile_withdrawals(limit=100, now=None, *, gateway=None):
+    _recycle_connection()
     now = now or timezone.now()
     if limit <= 0:
         return {
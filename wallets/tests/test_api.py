@@ -1,8 +1,10 @@
 from datetime import timedelta
 
+from django.test.utils import override_settings
 from django.utils import timezone
 from rest_framework.test import APITestCase
 
+from wallets.api.serializers import TransactionSerializer
 from wallets.domain.services import WalletService, WithdrawalService
 from wallets.models import Transaction, Wallet
 
@@ -128,6 +130,24 @@ class WalletPhase4ApiTests(APITestCase):
         self.assertEqual(response.data["data"]["wallet"]["id"], self.wallet.id)
         self.assertEqual(len(response.data["data"]["recent_transactions"]), 1)
 
+    def test_wallet_detail_endpoint_rejects_invalid_recent(self):
+        cases = (
+            ("abc", "recent must be an integer"),
+            ("1.5", "recent must be an integer"),
+            ("0", "recent must be between 1 and 100"),
+            ("-3", "recent must be between 1 and 100"),
+            ("101", "recent must be between 1 and 100"),
+            ("1" * 5000, "recent must be between 1 and 100"),
+        )
+        for value, detail in cases:
+            with self.subTest(recent=value):
+                response = self.client.get(
+                    f"/api/wallets/{self.wallet.id}/?recent={value}"
+                )
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.data["detail"], detail)
+
     def test_transactions_endpoint_filters_by_type_and_status(self):
         WalletService.deposit(wallet_id=self.wallet.id, amount=100)
         WithdrawalService.schedule_withdrawal(
@@ -146,6 +166,37 @@ class WalletPhase4ApiTests(APITestCase):
         self.assertEqual(response.data["data"]["results"][0]["type"], "DEPOSIT")
         self.assertEqual(response.data["data"]["results"][0]["status"], "SUCCEEDED")
 
+    @override_settings(TIME_ZONE="Asia/Tehran")
+    def test_transaction_lists_match_model_serializer_output(self):
+        WalletService.deposit(wallet_id=self.wallet.id, amount=100)
+        WithdrawalService.schedule_withdrawal(
+            wallet_id=self.wallet.id,
+            amount=80,
+            execute_at=timezone.now() + timedelta(minutes=20),
+        )
+        expected = TransactionSerializer(
+            self.wallet.transactions.order_by("-created_at"), many=True
+        ).data
+
+        list_response = self.client.get(f"/api/wallets/{self.wallet.id}/transactions/")
+        detail_response = self.client.get(f"/api/wallets/{self.wallet.id}/?recent=2")
+
+        self.assertEqual(list_response.data["data"]["results"], expected)
+        self.assertEqual(detail_response.data["data"]["recent_transactions"], expected)
+        self.assertTrue(expected[0]["created_at"].endswith("+03:30"))
+        self.assertTrue(expected[0]["execute_at"].endswith("+03:30"))
+
+    def test_transactions_endpoint_rejects_unknown_filter_value(self):
+        response = self.client.get(
+            f"/api/wallets/{self.wallet.id}/transactions/?type=DEPOSIT&status=DONE"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data["status"], 400)
+        self.assertEqual(
+            response.data["detail"]["status"], ['"DONE" is not a valid choice.']
+        )
+
     def test_schedule_withdrawal_endpoint_rejects_past_execute_at(self):
         execute_at = (timezone.now() - timedelta(minutes=1)).isoformat()
 
@@ -0,0 +1,33 @@
+from unittest.mock import patch
+
+from django.test import SimpleTestCase
+
+from wallet import config
+
+
+class EnvBoolTests(SimpleTestCase):
+    def test_blank_value_is_false_even_when_default_is_true(self):
+        with patch.dict(config._ENV_CACHE, {"FLAG": " "}, clear=True):
+            self.assertFalse(config.env_bool("FLAG", default=True))
+
+    def test_unset_value_uses_default(self):
+        with patch.dict(config._ENV_CACHE, {}, clear=True):
+            self.assertTrue(config.env_bool("FLAG", default=True))
+
+    def test_only_known_truthy_spellings_are_true(self):
+        for value, expected in [("1", True), ("On", True), ("y", False), ("t", False)]:
+            with patch.dict(config._ENV_CACHE, {"FLAG": value}, clear=True):
+                self.assertIs(config.env_bool("FLAG"), expected, value)
+
+
+class DatabaseUrlTests(SimpleTestCase):
+    def test_password_with_unencoded_at_sign_splits_on_last_at(self):
+        database = config._database_from_url(
+            "/srv/app", "postgres://wallet:p@ss@db.internal:5433/wallet"
+        )
+
+        self.assertEqual(database["USER"], "wallet")
+        self.assertEqual(database["PASSWORD"], "p@ss")
+        self.assertEqual(database["HOST"], "db.internal")
+        self.assertEqual(database["PORT"], "5433")
+        self.assertEqual(database["NAME"], "wallet")
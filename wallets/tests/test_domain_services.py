@@ -45,6 +45,37 @@ class WalletServiceDepositTests(TestCase):
         with self.assertRaises(WalletNotFound):
             WalletService.deposit(wallet_id=999_999, amount=100)
 
+    def test_deposit_many_credits_each_wallet_and_creates_transactions(self):
+        first = Wallet.objects.create(balance=100)
+        second = Wallet.objects.create(balance=0)
+
+        txs = WalletService.deposit_many(
+            [(first.id, 50), (second.id, 20), (first.id, 30)]
+        )
+
+        first.refresh_from_db()
+        second.refresh_from_db()
+        self.assertEqual(first.balance, 180)
+        self.assertEqual(second.balance, 20)
+        self.assertEqual(len(txs), 3)
+        self.assertEqual(
+            Transaction.objects.filter(
+                type=Transaction.Type.DEPOSIT,
+                status=Transaction.Status.SUCCEEDED,
+            ).count(),
+            3,
+        )
+
+    def test_deposit_many_applies_nothing_when_a_wallet_is_missing(self):
+        wallet = Wallet.objects.create(balance=100)
+
+        with self.assertRaises(WalletNotFound):
+            WalletService.deposit_many([(wallet.id, 50), (999_999, 10)])
+
+        wallet.refresh_from_db()
+        self.assertEqual(wallet.balance, 100)
+        self.assertEqual(Transaction.objects.count(), 0)
+
     def test_deposit_reuses_existing_transaction_for_same_idempotency_key(self):
         wallet = Wallet.objects.create(balance=1_000)
 
@@ -1,6 +1,6 @@
 from datetime import timedelta
 from io import StringIO
-from threading import Thread
+from threading import Barrier, Thread, current_thread, main_thread
 from unittest.mock import Mock, patch
 
 from django.core.management import call_command
@@ -79,6 +79,82 @@ class ExecuteDueWithdrawalsTests(TestCase):
         self.assertEqual(wallet.balance, 100)
         gateway.transfer.assert_not_called()
 
+    def test_batch_debits_each_wallet_in_execute_at_order(self):
+        wallet = Wallet.objects.create(balance=100)
+        other_wallet = Wallet.objects.create(balance=50)
+        first = self._schedule_due_withdrawal(wallet, amount=60)
+        too_large = self._schedule_due_withdrawal(wallet, amount=60)
+        fits_after = self._schedule_due_withdrawal(wallet, amount=30)
+        other = self._schedule_due_withdrawal(other_wallet, amount=20)
+
+        gateway = Mock()
+        gateway.transfer.return_value = TransferResult(
+            outcome=TransferOutcome.SUCCESS,
+            reference="bank-ok",
+        )
+
+        summary = execute_due_withdrawals(limit=10, now=timezone.now(), gateway=gateway)
+
+        wallet.refresh_from_db()
+        other_wallet.refresh_from_db()
+        statuses = dict(
+            Transaction.objects.filter(
+                pk__in=[first.pk, too_large.pk, fits_after.pk, other.pk]
+            ).values_list("pk", "status")
+        )
+
+        self.assertEqual(summary["processed"], 4)
+        self.assertEqual(summary["succeeded"], 3)
+        self.assertEqual(summary["insufficient_funds"], 1)
+        self.assertEqual(statuses[first.pk], Transaction.Status.SUCCEEDED)
+        self.assertEqual(statuses[too_large.pk], Transaction.Status.FAILED)
+        self.assertEqual(statuses[fits_after.pk], Transaction.Status.SUCCEEDED)
+        self.assertEqual(statuses[other.pk], Transaction.Status.SUCCEEDED)
+        self.assertEqual(wallet.balance, 10)
+        self.assertEqual(other_wallet.balance, 30)
+        self.assertEqual(gateway.transfer.call_count, 3)
+
+    @override_settings(BANK_CONCURRENCY=1, WITHDRAWAL_PROCESSING_STALE_SECONDS=1)
+    def test_batch_slower_than_stale_window_is_not_reclaimed(self):
+        wallet = Wallet.objects.create(balance=1_000)
+        for _ in range(3):
+            self._schedule_due_withdrawal(wallet, amount=100)
+
+        clock = [timezone.now()]
+        reclaimed = []
+
+        def slow_transfer(**kwargs):
+            # Each send stays inside the stale window, the whole batch does not;
+            # another executor looks for stale rows while this one is sending.
+            clock[0] += timedelta(seconds=0.6)
+            reclaimed.append(
+                execute_withdrawals_module._claim_stale_processing_withdrawal(
+                    clock[0], stale_after_seconds=1
+                )
+            )
+            return TransferResult(outcome=TransferOutcome.SUCCESS, reference="ok")
+
+        gateway = Mock()
+        gateway.transfer.side_effect = slow_transfer
+
+        with patch("django.utils.timezone.now", side_effect=lambda: clock[0]):
+            summary = execute_due_withdrawals(limit=10, now=clock[0], gateway=gateway)
+
+        self.assertEqual(summary["succeeded"], 3)
+        self.assertEqual(reclaimed, [None, None, None])
+        self.assertEqual(gateway.transfer.call_count, 3)
+
+    def test_recycles_connection_outside_transactions_only(self):
+        with patch.object(execute_withdrawals_module, "connection") as connection_mock:
+            connection_mock.in_atomic_block = False
+            execute_due_withdrawals(limit=0)
+            connection_mock.close_if_unusable_or_obsolete.assert_called_once_with()
+
+            connection_mock.reset_mock()
+            connection_mock.in_atomic_block = True
+            execute_due_withdrawals(limit=0)
+            connection_mock.close_if_unusable_or_obsolete.assert_not_called()
+
     def test_bank_failure_refunds_wallet_and_marks_failed(self):
         wallet = Wallet.objects.create(balance=900)
         tx = self._schedule_due_withdrawal(wallet, amount=400)
@@ -101,6 +177,66 @@ class ExecuteDueWithdrawalsTests(TestCase):
         self.assertEqual(tx.failure_reason, "bank_failed")
         self.assertEqual(wallet.balance, 900)
 
+    def test_batch_settles_mixed_outcomes_and_refunds_each_failure(self):
+        wallet = Wallet.objects.create(balance=1_000)
+        first = self._schedule_due_withdrawal(wallet, amount=100)
+        second = self._schedule_due_withdrawal(wallet, amount=200)
+        third = self._schedule_due_withdrawal(wallet, amount=300)
+
+        gateway = Mock()
+        gateway.transfer.side_effect = lambda **kwargs: (
+            TransferResult(outcome=TransferOutcome.SUCCESS, reference="bank-ref")
+            if kwargs["amount"] == 200
+            else TransferResult(
+                outcome=TransferOutcome.FINAL_FAILURE,
+                error_reason="bank_failed",
+            )
+        )
+
+        summary = execute_due_withdrawals(limit=10, now=timezone.now(), gateway=gateway)
+
+        wallet.refresh_from_db()
+        statuses = dict(
+            Transaction.objects.filter(
+                pk__in=[first.pk, second.pk, third.pk]
+            ).values_list("pk", "status")
+        )
+
+        self.assertEqual(summary["processed"], 3)
+        self.assertEqual(summary["succeeded"], 1)
+        self.assertEqual(summary["failed"], 2)
+        self.assertEqual(statuses[first.pk], Transaction.Status.FAILED)
+        self.assertEqual(statuses[second.pk], Transaction.Status.SUCCEEDED)
+        self.assertEqual(statuses[third.pk], Transaction.Status.FAILED)
+        self.assertEqual(wallet.balance, 800)
+
+    def test_finalize_skips_rows_settled_during_transfer(self):
+        wallet = Wallet.objects.create(balance=900)
+        tx = self._schedule_due_withdrawal(wallet, amount=400)
+
+        def settle_elsewhere(**kwargs):
+            Transaction.objects.filter(pk=tx.pk).update(
+                status=Transaction.Status.SUCCEEDED
+            )
+            return TransferResult(
+                outcome=TransferOutcome.FINAL_FAILURE,
+                error_reason="bank_failed",
+            )
+
+        gateway = Mock()
+        gateway.transfer.side_effect = settle_elsewhere
+
+        summary = execute_due_withdrawals(limit=1, now=timezone.now(), gateway=gateway)
+
+        tx.refresh_from_db()
+        wallet.refresh_from_db()
+
+        self.assertEqual(summary["processed"], 0)
+        self.assertEqual(summary["failed"], 0)
+        self.assertEqual(tx.status, Transaction.Status.SUCCEEDED)
+        self.assertIsNone(tx.failure_reason)
+        self.assertEqual(wallet.balance, 500)
+
     def test_gateway_exception_marks_failed_and_refunds_wallet(self):
         wallet = Wallet.objects.create(balance=700)
         tx = self._schedule_due_withdrawal(wallet, amount=250)
@@ -291,17 +427,17 @@ class ExecuteDueWithdrawalsTests(TestCase):
             reference="bank-ok",
         )
 
-        original_claim = execute_withdrawals_module._claim_next_due_withdrawal
+        original_claim = execute_withdrawals_module._claim_due_withdrawals
         calls = {"count": 0}
 
-        def flaky_claim(now):
+        def flaky_claim(now, limit):
             if calls["count"] == 0:
                 calls["count"] += 1
                 raise OperationalError("database is locked")
-            return original_claim(now)
+            return original_claim(now, limit)
 
         with patch(
-            "wallets.tasks.execute_withdrawals._claim_next_due_withdrawal",
+            "wallets.tasks.execute_withdrawals._claim_due_withdrawals",
             side_effect=flaky_claim,
         ):
             summary = execute_due_withdrawals(
@@ -328,7 +464,7 @@ class ExecuteDueWithdrawalsTests(TestCase):
         gateway = Mock()
 
         with patch(
-            "wallets.tasks.execute_withdrawals._claim_next_due_withdrawal",
+            "wallets.tasks.execute_withdrawals._claim_due_withdrawals",
             side_effect=OperationalError("database is locked"),
         ):
             summary = execute_due_withdrawals(
@@ -346,6 +482,28 @@ class ExecuteDueWithdrawalsTests(TestCase):
         self.assertEqual(wallet.balance, 400)
         gateway.transfer.assert_not_called()
 
+    @override_settings(
+        EXECUTOR_LOCK_CONTENTION_MAX_RETRIES=3,
+        EXECUTOR_LOCK_CONTENTION_BACKOFF_SECONDS=0.1,
+        EXECUTOR_LOCK_CONTENTION_BACKOFF_CAP_SECONDS=0.25,
+    )
+    def test_lock_contention_backoff_grows_up_to_cap(self):
+        with (
+            patch(
+                "wallets.tasks.execute_withdrawals._claim_due_withdrawals",
+                side_effect=OperationalError("database is locked"),
+            ),
+            patch(
+                "wallets.integrations.retry.thread_rng",
+                return_value=Mock(random=Mock(return_value=1.0)),
+            ),
+            patch("wallets.tasks.execute_withdrawals.time.sleep") as sleep_mock,
+        ):
+            execute_due_withdrawals(limit=10, now=timezone.now(), gateway=Mock())
+
+        delays = [call.args[0] for call in sleep_mock.call_args_list]
+        self.assertEqual(delays, [0.1, 0.2, 0.25])
+
 
 class ExecuteDueWithdrawalsConcurrencyTests(TransactionTestCase):
     reset_sequences = True
@@ -429,6 +587,137 @@ class WithdrawalExecutorCommandTests(TestCase):
         execute_mock.assert_called_once()
         self.assertIn("processed=1", stdout.getvalue())
 
+    @override_settings(WORKER_STARTUP_JITTER_MAX=0, WORKER_LOOP_JITTER_MAX=0)
+    @patch("wallets.management.commands.run_withdrawal_executor.BankGateway")
+    @patch("wallets.management.commands.run_withdrawal_executor.time.sleep")
+    @patch(
+        "wallets.management.commands.run_withdrawal_executor.execute_due_withdrawals"
+    )
+    def test_command_loop_skips_sleep_while_backlogged(
+        self, execute_mock, sleep_mock, gateway_mock
+    ):
+        execute_mock.side_effect = [
+            {"processed": 2, "succeeded": 2, "failed": 0, "insufficient_funds": 0},
+            {"processed": 1, "succeeded": 1, "failed": 0, "insufficient_funds": 0},
+        ]
+        sleep_mock.side_effect = KeyboardInterrupt
+
+        with self.assertRaises(KeyboardInterrupt):
+            call_command(
+                "run_withdrawal_executor",
+                limit=2,
+                loop=True,
+                sleep_seconds=5,
+                stdout=StringIO(),
+            )
+
+        self.assertEqual(execute_mock.call_count, 2)
+        sleep_mock.assert_called_once_with(5.0)
+        gateway_mock.return_value.warmup.assert_called_once_with()
+
+    @override_settings(WORKER_STARTUP_JITTER_MAX=0, WORKER_LOOP_JITTER_MAX=0)
+    @patch("wallets.management.commands.run_withdrawal_executor.BankGateway")
+    @patch("wallets.management.commands.run_withdrawal_executor.time.sleep")
+    @patch(
+        "wallets.management.commands.run_withdrawal_executor.execute_due_withdrawals"
+    )
+    def test_command_loop_halves_batch_after_rate_limiting(
+        self, execute_mock, sleep_mock, gateway_mock
+    ):
+        execute_mock.side_effect = [
+            {
+                "processed": 8,
+                "succeeded": 5,
+                "failed": 3,
+                "insufficient_funds": 0,
+                "rate_limited": 3,
+            },
+            {"processed": 4, "succeeded": 4, "failed": 0, "insufficient_funds": 0},
+            {"processed": 0, "succeeded": 0, "failed": 0, "insufficient_funds": 0},
+        ]
+        sleep_mock.side_effect = [None, KeyboardInterrupt]
+
+        with self.assertRaises(KeyboardInterrupt):
+            call_command(
+                "run_withdrawal_executor",
+                limit=8,
+                loop=True,
+                sleep_seconds=1,
+                stdout=StringIO(),
+            )
+
+        limits = [call.kwargs["limit"] for call in execute_mock.call_args_list]
+        self.assertEqual(limits, [8, 4, 5])
+
+    @patch("wallets.management.commands.run_withdrawal_executor.reconcile_withdrawals")
+    @patch(
+        "wallets.management.commands.run_withdrawal_executor.execute_due_withdrawals"
+    )
+    def test_command_runs_passes_sequentially_without_skip_locked(
+        self, execute_mock, reconcile_mock
+    ):
+        threads = []
+
+        def execute_pass(**kwargs):
+            threads.append(current_thread())
+            return {
+                "processed": 0,
+                "succeeded": 0,
+                "failed": 0,
+                "insufficient_funds": 0,
+            }
+
+        def reconcile_pass(**kwargs):
+            threads.append(current_thread())
+            return {"resolved_success": 0, "resolved_failure": 0}
+
+        execute_mock.side_effect = execute_pass
+        reconcile_mock.side_effect = reconcile_pass
+
+        with patch(
+            "wallets.management.commands.run_withdrawal_executor.connection"
+        ) as connection_mock:
+            connection_mock.features.has_select_for_update_skip_locked = False
+            call_command("run_withdrawal_executor", limit=2, stdout=StringIO())
+
+        self.assertEqual(threads, [main_thread(), main_thread()])
+
+    @patch("wallets.management.commands.run_withdrawal_executor.reconcile_withdrawals")
+    @patch(
+        "wallets.management.commands.run_withdrawal_executor.execute_due_withdrawals"
+    )
+    def test_command_runs_passes_concurrently_with_skip_locked(
+        self, execute_mock, reconcile_mock
+    ):
+        both_started = Barrier(2, timeout=5)
+
+        def execute_pass(**kwargs):
+            both_started.wait()
+            return {
+                "processed": 1,
+                "succeeded": 1,
+                "failed": 0,
+                "insufficient_funds": 0,
+            }
+
+        def reconcile_pass(**kwargs):
+            both_started.wait()
+            return {"resolved_success": 2, "resolved_failure": 0}
+
+        execute_mock.side_effect = execute_pass
+        reconcile_mock.side_effect = reconcile_pass
+        stdout = StringIO()
+
+        with patch(
+            "wallets.management.commands.run_withdrawal_executor.connection"
+        ) as connection_mock:
+            connection_mock.features.has_select_for_update_skip_locked = True
+            call_command("run_withdrawal_executor", limit=2, stdout=stdout)
+
+        # Neither pass returns until both are running at once.
+        self.assertIn("processed=1", stdout.getvalue())
+        self.assertIn("reconciled_success=2", stdout.getvalue())
+
     def test_command_rejects_non_positive_limit(self):
         with self.assertRaises(CommandError):
             call_command("run_withdrawal_executor", limit=0)
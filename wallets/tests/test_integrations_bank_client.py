@@ -1,6 +1,7 @@
 from unittest.mock import Mock
 
 from django.test import SimpleTestCase
+from django.test.utils import override_settings
 
 from wallets.integrations.bank_client import BankGateway, TransferOutcome
 from wallets.integrations.http import NetworkRequestFailed
@@ -180,3 +181,24 @@ class BankGatewayTests(SimpleTestCase):
         gateway.transfer(idempotency_key="idem-key-7", amount=100)
 
         limiter.acquire.assert_called()
+
+    @override_settings(
+        BANK_STATUS_URL_TEMPLATE="http://bank.local/status/{idempotency_key}?ref={reference}&pct=5%"
+    )
+    def test_query_transfer_status_formats_status_url(self):
+        http_client = Mock()
+        response = self._response(200, {"data": "success", "status": "200"})
+        http_client.get_json.return_value = response
+
+        gateway = BankGateway(base_url="http://bank.local", http_client=http_client)
+        result = gateway.query_transfer_status(
+            idempotency_key="idem-key-8",
+            reference="bank-ref-8",
+        )
+
+        self.assertTrue(result.success)
+        self.assertEqual(result.reference, "bank-ref-8")
+        http_client.get_json.assert_called_once_with(
+            "http://bank.local/status/idem-key-8?ref=bank-ref-8&pct=5%",
+            headers={"X-Idempotency-Key": "idem-key-8"},
+        )
@@ -1,9 +1,14 @@
+from threading import Thread
 from unittest.mock import Mock
 
 import requests
 from django.test import SimpleTestCase
 
-from wallets.integrations.http import HttpClient, NetworkRequestFailed
+from wallets.integrations.http import (
+    HttpClient,
+    NetworkRequestFailed,
+    shared_session,
+)
 
 
 class HttpClientTests(SimpleTestCase):
@@ -49,3 +54,28 @@ class HttpClientTests(SimpleTestCase):
             client.post_json("http://bank.local/", json={"amount": 100})
 
         self.assertEqual(session.post.call_count, 2)
+
+    def test_warmup_sends_parallel_head_requests_and_ignores_errors(self):
+        session = Mock()
+        session.head.side_effect = [Mock(), requests.ConnectionError("down"), Mock()]
+
+        client = HttpClient(session=session, connect_timeout=0.5, read_timeout=2.0)
+
+        warmed = client.warmup("http://bank.local/", connections=3)
+
+        self.assertEqual(warmed, 2)
+        self.assertEqual(session.head.call_count, 3)
+        session.head.assert_called_with("http://bank.local/", timeout=(0.5, 2.0))
+
+    def test_shared_session_is_per_thread_over_one_pool(self):
+        sessions = []
+        thread = Thread(target=lambda: sessions.append(shared_session()))
+        thread.start()
+        thread.join()
+
+        self.assertIs(shared_session(), shared_session())
+        self.assertIsNot(sessions[0], shared_session())
+        self.assertIs(
+            sessions[0].get_adapter("https://bank.example"),
+            shared_session().get_adapter("https://bank.example"),
+        )
@@ -1,10 +1,13 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from django.test import SimpleTestCase
+from django.test.utils import override_settings
 
+from wallets.integrations import rate_limiter as rate_limiter_module
 from wallets.integrations.rate_limiter import (
     NoopRateLimiter,
     RedisTokenBucketRateLimiter,
+    build_rate_limiter,
 )
 
 
@@ -16,14 +19,53 @@ class RateLimiterTests(SimpleTestCase):
         self.assertEqual(result.wait_events, 0)
 
     def test_redis_token_bucket_limiter_waits_then_allows(self):
+        script = Mock(return_value=[b"0.25", b"-2.5", b"1"])
         redis_client = Mock()
-        redis_client.register_script.return_value = Mock(side_effect=[[0, 0], [1, 0]])
+        redis_client.register_script.return_value = script
 
         limiter = RedisTokenBucketRateLimiter(
             redis_client=redis_client,
             key="wallet:test",
             max_rps=10,
         )
-        result = limiter.acquire(cost=1)
+        with patch("wallets.integrations.rate_limiter.time.sleep") as sleep:
+            result = limiter.acquire(cost=1)
 
         self.assertEqual(result.wait_events, 1)
+        self.assertEqual(result.wait_seconds, 0.25)
+        self.assertEqual(result.tokens_remaining, -2.5)
+        self.assertEqual(result.capacity, 1.0)
+        sleep.assert_called_once_with(0.25)
+        script.assert_called_once()
+
+    def test_redis_token_bucket_limiter_serves_acquires_from_local_lease(self):
+        script = Mock(return_value=[b"0", b"2", b"3"])
+        redis_client = Mock()
+        redis_client.register_script.return_value = script
+
+        limiter = RedisTokenBucketRateLimiter(
+            redis_client=redis_client,
+            key="wallet:test",
+            max_rps=10,
+            lease_size=3,
+        )
+        for _ in range(4):
+            limiter.acquire(cost=1)
+
+        self.assertEqual(script.call_count, 2)
+        self.assertEqual(script.call_args.kwargs["args"][1:], [3.0, 3.0])
+
+    @override_settings(BANK_MAX_RPS=5)
+    def test_build_rate_limiter_reuses_connected_limiter(self):
+        self.addCleanup(rate_limiter_module._connect_redis_limiter.cache_clear)
+        with patch("redis.Redis.from_url") as from_url:
+            from_url.return_value.ping.side_effect = [ConnectionError("down"), True]
+
+            first = build_rate_limiter()
+            second = build_rate_limiter()
+            third = build_rate_limiter()
+
+        self.assertIsInstance(first, NoopRateLimiter)
+        self.assertIsInstance(second, RedisTokenBucketRateLimiter)
+        self.assertIs(third, second)
+        self.assertEqual(from_url.call_count, 2)
@@ -1,4 +1,4 @@
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 from django.test import SimpleTestCase
 
@@ -35,3 +35,9 @@ class RetryHelpersTests(SimpleTestCase):
         self.assertEqual(result, "ok")
         self.assertEqual(fn.call_count, 2)
         on_retry.assert_called_once()
+
+    def test_parse_retry_after_seconds_for_http_date(self):
+        with patch("wallets.integrations.retry.time.time", return_value=1445412470.0):
+            delay = parse_retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT")
+
+        self.assertEqual(delay, 10.0)
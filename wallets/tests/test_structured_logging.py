@@ -0,0 +1,41 @@
+import json
+import logging
+import sys
+
+from django.test import SimpleTestCase
+
+from wallet.logging import StructuredFormatter
+
+
+class StructuredFormatterTests(SimpleTestCase):
+    @staticmethod
+    def _record(msg, *args, exc_info=None):
+        return logging.LogRecord(
+            name="wallets.test",
+            level=logging.WARNING,
+            pathname=__file__,
+            lineno=1,
+            msg=msg,
+            args=args,
+            exc_info=exc_info,
+        )
+
+    def test_escapes_quotes_and_newlines_in_message(self):
+        record = self._record("event=x reason=%s", 'bad "quote"\nnext line')
+
+        payload = json.loads(StructuredFormatter().format(record))
+
+        self.assertEqual(payload["level"], "WARNING")
+        self.assertEqual(payload["logger"], "wallets.test")
+        self.assertEqual(payload["message"], 'event=x reason=bad "quote"\nnext line')
+        self.assertIn("ts", payload)
+
+    def test_includes_exception_text(self):
+        try:
+            raise RuntimeError("boom")
+        except RuntimeError:
+            record = self._record("event=failed", exc_info=sys.exc_info())
+
+        payload = json.loads(StructuredFormatter().format(record))
+
+        self.assertIn("RuntimeError: boom", payload["exc_info"])
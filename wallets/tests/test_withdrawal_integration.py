@@ -7,10 +7,7 @@ from django.utils import timezone
 from wallets.domain.exceptions import InvalidTransactionState
 from wallets.domain.services import WithdrawalService
 from wallets.integrations.bank_client import TransferOutcome, TransferResult
-from wallets.integrations.idempotency import (
-    ensure_transaction_idempotency_key,
-    generate_idempotency_key,
-)
+from wallets.integrations.idempotency import generate_idempotency_key
 from wallets.models import Transaction, Wallet, WithdrawalReconciliationTask
 
 
@@ -23,31 +20,6 @@ class IdempotencyHelpersTests(TestCase):
         self.assertEqual(len(first), 32)
         self.assertEqual(len(second), 32)
 
-    def test_ensure_returns_existing_withdrawal_key(self):
-        wallet = Wallet.objects.create(balance=500)
-        tx = WithdrawalService.schedule_withdrawal(
-            wallet_id=wallet.id,
-            amount=100,
-            execute_at=timezone.now() + timedelta(minutes=30),
-        )
-
-        original = tx.idempotency_key
-        ensured = ensure_transaction_idempotency_key(tx)
-
-        self.assertEqual(ensured, original)
-
-    def test_ensure_raises_for_deposit_transaction(self):
-        wallet = Wallet.objects.create(balance=500)
-        tx = Transaction.objects.create(
-            wallet=wallet,
-            type="DEPOSIT",
-            status="SUCCEEDED",
-            amount=100,
-        )
-
-        with self.assertRaises(ValueError):
-            ensure_transaction_idempotency_key(tx)
-
 
 class WithdrawalExecuteTests(TestCase):
     @staticmethod